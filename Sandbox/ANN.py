@@ -380,7 +380,7 @@ if __name__ == "__main__":
         'street': 0,
         'pot': 2.0,
         'main_pot': 0.0,
-        'side_pot': 0.0,
+        'side_pots': (0.0,) * 8,
         'community_cards': [],
         'dealer_position': 0,
         'current_player': 0
@@ -3,341 +3,366 @@ GameController.py - Game logic and state management for PLO8 poker
 Handles all game rules, betting, hand evaluation, and state transitions
 """
 
-import random
 import json
-from decimal import Decimal, getcontext, ROUND_HALF_UP
+from bisect import bisect_left, bisect_right
+from enum import IntEnum
+from types import MappingProxyType
+
+import numpy as np
 
 import handEvaluator
+from handEvaluator import CARD_STR
+
+# Money is kept as int cents of a big blind: every bet, stack and pot update is an int add
+SB = 50     # small blind, 0.50bb
+BB = 100    # big blind, 1.00bb
+MIN_BET = 2 * BB    # min allowed bet preflop that's not a call
+N_POTS = 9          # main pot + up to 8 side pots
+
+FULL_DECK = np.array(handEvaluator.CARDS, dtype=np.uint32)   # 32-bit Cactus-Kev card ints
+
+
+class Status(IntEnum):
+    """Player status, stored as a small int. get_game_state reports it as a lowercase string."""
+    ACTIVE = 0
+    FOLDED = 1
+
 
-# Decimal configuration
-getcontext().prec = 28
-getcontext().rounding = ROUND_HALF_UP
-CENTS = Decimal("0.01")
+ACTIVE, FOLDED = Status.ACTIVE, Status.FOLDED
+STATUS_STR = tuple(status.name.lower() for status in Status)   # 'active', 'folded'
 
 class PLO8:
+    # One controller field per slot: no per-instance __dict__, and every self.<field> in the
+    # action handlers is a slot load
+    __slots__ = (
+        'starting_players', 'starting_stack', 'starting_stack_cents', 'human_in_loop', 'verbose',
+        'dump_state', 'state_file', 'check_invariants',
+        'seats', 'stacks', 'bets', 'max_bet', 'status', 'cards', 'acted', 'allin', 'contribs',
+        'action_order', 'active_count', 'unacted_count', 'next_seat', 'blind_seats',
+        'street', 'pot', 'pots', 'community_cards', 'rng', 'deck_buffer', 'deck', 'deck_idx',
+        'dealer_position', 'current_player', 'state_version', 'state_cache', 'running',
+    )
+
     def __init__(self, settings):
         """Initialize game controller with settings"""
         # Settings
         self.starting_players = settings[0]
         self.starting_stack = settings[1]
+        self.starting_stack_cents = round(self.starting_stack * 100)
         self.human_in_loop = settings[2]
+        self.verbose = settings[3] if len(settings) > 3 else False   # print game progress to the console
+        self.dump_state = settings[4] if len(settings) > 4 else False   # write game_state.json after every action
+        seed = settings[5] if len(settings) > 5 else None   # int for repeatable shuffles and dealer draw
+        self.state_file = None      # opened on the first dump, then kept open and rewritten in place; see close
+        self.check_invariants = False   # debugging aid: verify no chips were created or lost after every action
         
         # Game state
-        self.players = []
+        # Players are stored struct-of-arrays: one list per field, indexed by player
+        self.seats = []         # seat number each player sat down at
+        self.stacks = []
+        self.bets = []          # bet in the current betting round
+        self.max_bet = 0        # highest bet in the current betting round, i.e. max(self.bets)
+        self.status = []        # Status.ACTIVE, Status.FOLDED
+        self.cards = []         # 4 hole cards for PLO8
+        self.acted = []
+        self.allin = []
+        self.contribs = []      # total contribution to the pot this hand
+        self.action_order = []  # sorted indices of players still able to act (active, not all-in)
+        self.active_count = 0   # players who haven't folded this hand
+        self.unacted_count = 0  # players in action_order who haven't acted since the last bet or raise
+        self.next_seat = []     # seat to the left of each seat
+        self.blind_seats = []   # (small blind, big blind, first to act) for each dealer position
         self.street = 0     #Street int: 0: Preflop, 1:Flop, 2:Turn, 3:River, 4:Showdown
-        self.pot = Decimal("0.00")    # total pot
-        self.main_pot = Decimal("0.00")   # main pot
-        self.side_pot = Decimal("0.00")   # side pot
-        self.side_pot1 = Decimal("0.00")   # side pot +1
-        self.side_pot2 = Decimal("0.00")   # side pot +2
-        self.side_pot3 = Decimal("0.00")   # side pot +3
-        self.side_pot4 = Decimal("0.00")   # side pot +4
-        self.side_pot5 = Decimal("0.00")   # side pot +5
-        self.side_pot6 = Decimal("0.00")   # side pot +6
-        self.side_pot7 = Decimal("0.00")   # side pot +7
+        self.pot = 0    # total pot (cents, like every money field)
+        self.pots = [0] * N_POTS    # pots[0] is the main pot, pots[1:] the side pots in order
         self.community_cards = []
+        self.rng = np.random.default_rng(seed)   # deck shuffles and dealer draw
+        self.deck_buffer = FULL_DECK.copy()  # compact deck, reshuffled in place every hand
         self.dealer_position = 0
         self.current_player = 0
 
+        self.state_version = 0      # bumped whenever the game changes, see get_game_state
+        self.state_cache = None     # (version, state dict) last returned by get_game_state
+
         self.running = True
         self.init_game()
         self.new_hand()
     
-    def q(self, value):
-        """Quantize a Decimal value to cents."""
-        if not isinstance(value, Decimal):
-            value = Decimal(str(value))
-        return value.quantize(CENTS)
+    def close(self):
+        """Close the game_state.json dump file, if one was opened"""
+        if self.state_file is not None:
+            self.state_file.close()
+            self.state_file = None
 
     def init_game(self):
         """Initialize a new game"""
         # Create players
-        self.players = []
-        for i in range(self.starting_players):
-            player = {
-                'seat': i,
-                'stack': Decimal(str(self.starting_stack)),
-                'bet': Decimal("0.00"),
-                'status': 'active',     # active, folded 
-                'cards': [None, None, None, None],  # 4 hole cards for PLO8
-                'acted': False,
-                'allin': False,
-                'contrib': Decimal("0.00")
-            }
-            self.players.append(player)
+        n = self.starting_players
+        self.seats = list(range(n))
+        self.stacks = [self.starting_stack_cents] * n
+        self.bets = [0] * n
+        self.status = [ACTIVE] * n
+        self.cards = [[None, None, None, None] for _ in range(n)]
+        self.acted = [False] * n
+        self.allin = [False] * n
+        self.contribs = [0] * n
+        self.build_seat_tables()
         
         # Random dealer position
-        self.dealer_position = random.randint(0, self.starting_players-1)
-        print(f"Game initialized: {self.starting_players} players, dealer at seat {self.dealer_position}")
+        self.dealer_position = int(self.rng.integers(self.starting_players))
+        if self.verbose:
+            print(f"Game initialized: {self.starting_players} players, dealer at seat {self.dealer_position}")
 
     def new_hand(self):
+        self.state_version += 1
         # Eject the brokies
-        self.players = [p for p in self.players if p['stack'] != Decimal("0.00")]
-        if len(self.players) < 2 and self.pot == Decimal("0.00"):
-            print("Not enough players to start a new hand. Game Over.")
+        keep = [i for i, stack in enumerate(self.stacks) if stack != 0]
+        if len(keep) < len(self.stacks):
+            self.seats = [self.seats[i] for i in keep]
+            self.stacks = [self.stacks[i] for i in keep]
+            self.bets = [self.bets[i] for i in keep]
+            self.status = [self.status[i] for i in keep]
+            self.cards = [self.cards[i] for i in keep]
+            self.acted = [self.acted[i] for i in keep]
+            self.allin = [self.allin[i] for i in keep]
+            self.contribs = [self.contribs[i] for i in keep]
+            self.build_seat_tables()
+        if len(self.stacks) < 2 and self.pot == 0:
+            if self.verbose:
+                print("Not enough players to start a new hand. Game Over.")
             self.running = False
             return
+        self.dealer_position %= len(self.stacks)   # keep the button in range after ejections, it still moves on to the same seat
 
         # Reset pot, street, update dealer position, deal new cards, reset player flags, community cards
-        self.pot, self.main_pot, self.side_pot = Decimal("0.00"), Decimal("0.00"), Decimal("0.00")
-        self.side_pot1, self.side_pot2, self.side_pot3 = Decimal("0.00"), Decimal("0.00"), Decimal("0.00")
-        self.side_pot4, self.side_pot5, self.side_pot6, self.side_pot7 = Decimal("0.00"), Decimal("0.00"), Decimal("0.00"), Decimal("0.00")
+        self.pot = 0
+        self.pots = [0] * N_POTS
         self.street = 0
-        self.dealer_position = (self.dealer_position + 1) % len(self.players)
+        self.dealer_position = self.next_seat[self.dealer_position]
         self.community_cards = []
         self.init_deck()
-        for player in self.players:
-            player['bet'] = Decimal("0.00")
-            player['status'] = 'active'
-            player['cards'] = [self.deal_card(), self.deal_card(), self.deal_card(), self.deal_card()]
-            player['acted'] = False
-            player['allin'] = False
-            player['contrib'] = Decimal("0.00")   # reset contribution for new hand
-        
-        # 2 Player blinds set up
-        if len(self.players) == 2:
-            #small blind
-            sb_idx = self.dealer_position % len(self.players)
-            bb_idx = (self.dealer_position+1) % len(self.players)
-
-            if self.players[sb_idx]['stack'] > Decimal("0.50"):
-                self.players[sb_idx]['stack'] -= Decimal("0.50")
-                self.players[sb_idx]['bet'] = Decimal("0.50")
-                self.players[sb_idx]['contrib'] += Decimal("0.50")
-                self.pot += Decimal("0.50")
-            else:
-                # all-in small blind
-                added = self.players[sb_idx]['stack']
-                self.players[sb_idx]['bet'] = added
-                self.players[sb_idx]['contrib'] += added
-                self.players[sb_idx]['stack'] = Decimal("0.00")
-                self.players[sb_idx]['allin'] = True
-                self.pot += added
-
-            #big blind    
-            if self.players[bb_idx]['stack'] > Decimal("1.00"):
-                self.players[bb_idx]['stack'] -= Decimal("1.00")
-                self.players[bb_idx]['bet'] = Decimal("1.00")
-                self.players[bb_idx]['contrib'] += Decimal("1.00")
-                self.pot += Decimal("1.00")
-            else:
-                added = self.players[bb_idx]['stack']
-                self.players[bb_idx]['bet'] = added
-                self.players[bb_idx]['contrib'] += added
-                self.players[bb_idx]['stack'] = Decimal("0.00")
-                self.players[bb_idx]['allin'] = True
-                self.pot += added
-
-            self.current_player = self.dealer_position
-            return
-
-        # 3+ Player blinds set up
-        sb_idx = (self.dealer_position+1) % len(self.players)
-        bb_idx = (self.dealer_position+2) % len(self.players)
 
-        #small blind
-        if self.players[sb_idx]['stack'] > Decimal("0.50"):
-            self.players[sb_idx]['stack'] -= Decimal("0.50")
-            self.players[sb_idx]['bet'] = Decimal("0.50")
-            self.players[sb_idx]['contrib'] += Decimal("0.50")
-            self.pot += Decimal("0.50")
+        # Reset every per-player array and deal hole cards as slices of the deck in one pass
+        n = len(self.stacks)
+        deck = self.deck
+        self.bets, self.contribs = [0] * n, [0] * n
+        self.max_bet = 0
+        self.status, self.acted, self.allin = [ACTIVE] * n, [False] * n, [False] * n
+        self.cards = [deck[i:i + 4] for i in range(0, 4 * n, 4)]
+        self.deck_idx = 4 * n
+        self.action_order = list(range(n))
+        self.active_count = n
+        
+        # Blinds: seats come from the per-dealer table, so both table sizes share one code path
+        sb_idx, bb_idx, first_to_act = self.blind_seats[self.dealer_position]
+        self.post_blind(sb_idx, SB)
+        self.post_blind(bb_idx, BB)
+
+        self.unacted_count = len(self.action_order)
+        self.current_player = first_to_act
+
+    def post_blind(self, idx, amount):
+        """Post a blind for player idx, all-in if their stack doesn't cover it"""
+        if self.stacks[idx] > amount:
+            self.stacks[idx] -= amount
         else:
-            added = self.players[sb_idx]['stack']
-            self.players[sb_idx]['bet'] = added
-            self.players[sb_idx]['contrib'] += added
-            self.players[sb_idx]['stack'] = Decimal("0.00")
-            self.players[sb_idx]['allin'] = True
-            self.pot += added
-        #big blind
-        if self.players[bb_idx]['stack'] > Decimal("1.00"):
-            self.players[bb_idx]['stack'] -= Decimal("1.00")
-            self.players[bb_idx]['bet'] = Decimal("1.00")
-            self.players[bb_idx]['contrib'] += Decimal("1.00")
-            self.pot += Decimal("1.00")
+            amount = self.stacks[idx]
+            self.stacks[idx] = 0
+            self.allin[idx] = True
+            self.action_order.remove(idx)
+        self.bets[idx] = amount
+        self.contribs[idx] += amount
+        self.pot += amount
+        if amount > self.max_bet:
+            self.max_bet = amount
+
+    def reopen_action(self):
+        """A bet or raise (or a new street): everyone still able to act has to act again"""
+        self.acted = [False] * len(self.acted)
+        self.unacted_count = len(self.action_order)
+
+    def build_seat_tables(self):
+        """
+        Precompute the next seat and the blind seats for every position at the current table size.
+        Rebuilt only when the number of players changes.
+        """
+        n = len(self.stacks)
+        self.next_seat = nxt = [(i + 1) % n for i in range(n)]
+        if n == 2:
+            # Heads-up the dealer posts the small blind and acts first preflop
+            self.blind_seats = [(d, nxt[d], d) for d in range(n)]
         else:
-            added = self.players[bb_idx]['stack']
-            self.players[bb_idx]['bet'] = added
-            self.players[bb_idx]['contrib'] += added
-            self.players[bb_idx]['stack'] = Decimal("0.00")
-            self.players[bb_idx]['allin'] = True
-            self.pot += added
-
-        self.current_player = (self.dealer_position + 3) % len(self.players)
+            self.blind_seats = [(nxt[d], nxt[nxt[d]], nxt[nxt[nxt[d]]]) for d in range(n)]
 
 
     def get_game_state(self):
         """
         Return current game state for rendering
-        Returns dict with all necessary display information
+        Returns a mapping with all necessary display information
+
+        The state is cached and handed out again until the game changes, so callers
+        polling every frame share one object. It is read-only: the state and each player
+        are mapping proxies, and the player list and card lists are tuples.
         """
-        # Convert Decimals to floats for JSON serialization / display
-        players_copy = []
-        for p in self.players:
-            p_copy = p.copy()
-            # convert stack, bet, and contrib to float for JSON
-            if isinstance(p_copy.get('stack'), Decimal):
-                p_copy['stack'] = float(self.q(p_copy['stack']))
-            if isinstance(p_copy.get('bet'), Decimal):
-                p_copy['bet'] = float(self.q(p_copy['bet']))
-            if isinstance(p_copy.get('contrib'), Decimal):
-                p_copy['contrib'] = float(self.q(p_copy['contrib']))
-            players_copy.append(p_copy)
-
-        return {
+        if self.state_cache is not None and self.state_cache[0] == self.state_version:
+            return self.state_cache[1]
+
+        # Build one dict per player from the field lists
+        # Cents -> float bb and card ints -> 'HA' style strings for JSON serialization / display
+        card_str = CARD_STR.get
+        players_copy = tuple(MappingProxyType({
+                'seat': seat,
+                'stack': stack / 100,
+                'bet': bet / 100,
+                'status': STATUS_STR[status],
+                'cards': tuple(map(card_str, cards)),
+                'acted': acted,
+                'allin': allin,
+                'contrib': contrib / 100
+            }) for seat, stack, bet, status, cards, acted, allin, contrib
+            in zip(self.seats, self.stacks, self.bets, self.status, self.cards, self.acted, self.allin, self.contribs))
+
+        state = MappingProxyType({
             'players': players_copy,
             'street': self.street,
-            'pot': float(self.q(self.pot)),
-            'main_pot': float(self.q(self.main_pot)),
-            'side_pot': float(self.q(self.side_pot)),
-            'side_pot1': float(self.q(self.side_pot1)),
-            'side_pot2': float(self.q(self.side_pot2)),
-            'side_pot3': float(self.q(self.side_pot3)),
-            'side_pot4': float(self.q(self.side_pot4)),
-            'side_pot5': float(self.q(self.side_pot5)),
-            'side_pot6': float(self.q(self.side_pot6)),
-            'community_cards': self.community_cards,
+            'pot': self.pot / 100,
+            'main_pot': self.pots[0] / 100,
+            'side_pots': tuple([pot / 100 for pot in self.pots[1:]]),
+            'community_cards': tuple(map(card_str, self.community_cards)),
             'dealer_position': self.dealer_position,
             'current_player': self.current_player
-        }
+        })
+        self.state_cache = (self.state_version, state)
+        return state
 
     # Main loop from here
     def advance_game(self, action):
+        self.state_version += 1
         if self.street >= 4:
             self.new_hand()
             return
-        if len(self.players) == 1:
-            print("Game Over!")
+        if len(self.stacks) == 1:
+            if self.verbose:
+                print("Game Over!")
             self.running = False
             return
         #get player action, check to see if game over
         self.process_action(action)
         
         #handle end of hand where all but 1 player folds
-        if sum(1 for player in self.players if player['status'] == 'active') == 1 and self.street < 4:
-            winner = next((player for player in self.players if player['status'] == 'active'), None)
-            if winner == None:
-                raise Exception("Winner is none.")
-            winner['stack'] += self.q(self.pot)
-            print(f"Player {winner['seat']} wins the hand, starting new hand...")
+        if self.active_count == 1 and self.street < 4:
+            winner = self.status.index(ACTIVE)
+            self.stacks[winner] += self.pot
+            if self.verbose:
+                print(f"Player {self.seats[winner]} wins the hand, starting new hand...")
             self.new_hand()
             return
         
         # NEW: Check if betting should end due to all-in situations
-        action_players = [p for p in self.players if p['status'] == 'active' and not p['allin']]
+        action_players = self.action_order
+        n_actors = len(action_players)
         
         # If 0 or 1 players can still act, advance to next street
-        if len(action_players) <= 1:
+        if n_actors <= 1:
             # If there's exactly 1 player who can act, they need to match the highest bet first
-            if len(action_players) == 1:
+            if n_actors == 1:
                 solo_player = action_players[0]
-                max_bet = max(p['bet'] for p in self.players)
                 # If the solo player hasn't matched the bet yet and hasn't acted, let them act
-                if solo_player['bet'] < max_bet and not solo_player['acted']:
-                    self.current_player = solo_player['seat']
+                if self.bets[solo_player] < self.max_bet and not self.acted[solo_player]:
+                    self.current_player = solo_player
                     return
             
             # Otherwise, everyone is all-in or only one player left who has already acted
-            print("All players are all-in or have acted, advancing streets to showdown...")
+            if self.verbose:
+                print("All players are all-in or have acted, advancing streets to showdown...")
             while self.street < 4:
                 self.new_street()
             self.new_hand()
             return
         
         # Continue with normal betting round logic for 2+ active non-all-in players
-        if len(action_players) > 1:
-            all_bets_equal = len({p['bet'] for p in action_players}) == 1
-            all_have_acted = all(p['acted'] for p in action_players)
-            if all_bets_equal and all_have_acted:
+        if n_actors > 1:
+            # The acted counter is checked first, the bets only once everyone has acted
+            if self.unacted_count == 0 and len({self.bets[i] for i in action_players}) == 1:
                 self.new_street()
                 if self.street < 4:
                     return
                 self.new_hand()
                 return
         
-        # Find next player to act (existing logic but simplified)
-        next_player = (self.current_player + 1) % len(self.players)
-        attempts = 0
-        while attempts < len(self.players):
-            if self.players[next_player]['status'] == 'active' and not self.players[next_player]['allin']:
-                break
-            next_player = (next_player + 1) % len(self.players)
-            attempts += 1
-        
-        if attempts >= len(self.players):
-            # This shouldn't happen now with the above logic, but keeping as safety
-            print("ERROR: No valid next player found, advancing to showdown")
-            while self.street < 4:
-                self.new_street()
-            return
-        
-        #otherwise, just move on to next player in round of betting, dump gamestate
-        self.current_player = next_player
-        with open("game_state.json", "w") as f:
-            json.dump(self.get_game_state(), f, indent=4)
-        all_bb = self.pot + sum([p['stack'] for p in self.players])
-        if Decimal(str((self.starting_players * self.starting_stack))) != all_bb:
-            raise Exception(f'Invalid gamestate occurred: {Decimal(str((self.starting_players * self.starting_stack)))} != {sum(all_bb)}')
-
+        # Next player to act is the next index around the action order, dump gamestate for outside observers
+        self.current_player = action_players[bisect_right(action_players, self.current_player) % n_actors]
+        if self.dump_state:
+            if self.state_file is None:
+                self.state_file = open("game_state.json", "w")
+            self.state_file.seek(0)
+            self.state_file.truncate()
+            self.state_file.write(json.dumps(self.get_game_state(), separators=(',', ':'), default=dict))
+            self.state_file.flush()
+        if __debug__ and self.check_invariants:
+            all_bb = self.pot + sum(self.stacks)
+            if self.starting_players * self.starting_stack_cents != all_bb:
+                raise Exception(f'Invalid gamestate occurred: {self.starting_players * self.starting_stack_cents / 100} != {all_bb / 100}')
+
+
+    def build_pots(self):
+        """
+        Split this hand's contributions into the main pot and side pots.
+        Returns a list of {'amount': cents, 'eligible': [player indices]} from the main pot up:
+        each layer only goes to the players still in the hand who put in enough to reach it.
+        """
+        pots = []
+        prev = 0
+        ordered = sorted(self.contribs)
+        n = len(ordered)
+        for k, level in enumerate(ordered):
+            if level == prev:   # skips zero contributions and repeated levels
+                continue
+            # No contribution lies between two levels, so the n - k players at or above
+            # this level each put exactly level - prev into its layer
+            amount = (level - prev) * (n - k)
+            eligible = [i for i, contrib in enumerate(self.contribs) if contrib >= level and self.status[i] == ACTIVE]
+            # Levels set by folded players don't change who can win, so they stay in the same pot
+            if pots and (not eligible or eligible == pots[-1]['eligible']):
+                pots[-1]['amount'] += amount
+            else:
+                pots.append({'amount': amount, 'eligible': eligible})
+            prev = level
+        return pots
 
     def new_street(self):
-        if self.street == 0:
-            self.street = 1
-            self.end_betting_round()
-            self.deal_flop()
-            return
-        elif self.street == 1:
-            self.street = 2
-            self.end_betting_round()
-            self.deal_turn()
-            return
-        elif self.street == 2:
-            self.street = 3
-            self.end_betting_round()
-            self.deal_river()
-            return
-        elif self.street == 3:
-            self.street = 4
-            self.end_betting_round()
-            self.showdown()
-        else:
-            print("Error: Trying to advance past showdown!")
-            return
+        """Close the betting round and move to the next street: deal it, or go to showdown after the river"""
+        if self.street >= 4:
+            raise Exception(f'Invalid gamestate occurred: trying to advance past showdown (street {self.street})')
+        self.street += 1
+        self.end_betting_round()
+        (self.deal_flop, self.deal_turn, self.deal_river, self.showdown)[self.street - 1]()
 
-            
     def end_betting_round(self):
         """End of Betting Round Logic"""
-        allin_players = [player for player in self.players if player['allin'] == True]
-        allin_players_contribs = sorted([player['contrib'] for player in allin_players]) # smallest to largest contribs of allin players
-        
-        #visualize
-        pot_contributions = [player['contrib'] for player in self.players]      #index of pot_contributions is player seat number
-        #print(pot_contributions)
-
-        #no players are all in
-        if allin_players == []:
-            # Clear betting round related player states, put bets in main pot
-            for player in self.players:
-                player['acted'] = False
-                player['bet'] = Decimal("0.00")
-            self.main_pot = self.q(self.pot)  # put bets in main pot (unchanged behavior)
-
-        else:
-            # Clear per-round state (bets become zero; contrib keeps the full contributed amount)
-            for player in self.players:
-                player['acted'] = False
-                player['bet'] = Decimal("0.00")
+        n = len(self.stacks)
+        # Clear per-round state (bets become zero; contrib keeps the full contributed amount)
+        self.reopen_action()
+        self.bets = [0] * n
+        self.max_bet = 0
+
+        # Lay the hand's contributions out as a main pot plus a side pot per all-in level;
+        # with nobody all-in that is one main pot holding everything
+        amounts = [pot['amount'] for pot in self.build_pots()]
+        if len(amounts) > N_POTS:
+            amounts[N_POTS - 1:] = [sum(amounts[N_POTS - 1:])]
+        self.pots = amounts + [0] * (N_POTS - len(amounts))
 
         #showdown is last betting round
         if self.street == 4:
             return
         #start with small blind position for next betting round, if 2+ active non allin players remain
-        active_non_allin = [player for player in self.players if player['status'] == 'active' and player['allin'] == False]
+        active_non_allin = self.action_order
         if len(active_non_allin) > 1:
-            next_player = (self.dealer_position + 1 ) % len(self.players)
-            while self.players[next_player]['status'] != 'active' or self.players[next_player]['allin'] == True:
-                next_player = (next_player + 1) % len(self.players)
-            self.current_player = next_player
-            print(f'Next betting round starts with player {self.current_player}')
+            first = bisect_left(active_non_allin, self.next_seat[self.dealer_position])
+            self.current_player = active_non_allin[first % len(active_non_allin)]
+            if self.verbose:
+                print(f'Next betting round starts with player {self.current_player}')
 
     def process_action(self, action):
         """
@@ -346,265 +371,285 @@ class PLO8:
         """
         if action == 'check/fold':
             self.handle_checkfold()
-            self.players[self.current_player]['acted'] = True
         elif action == 'call/minbet':
             self.handle_callminbet()
-            self.players[self.current_player]['acted'] = True
         elif action == 'bet1/2pot':
             self.handle_bethalfpot()
-            self.players[self.current_player]['acted'] = True
         elif action == 'bet3/4pot':
             self.handle_betthreequarterspot()
-            self.players[self.current_player]['acted'] = True
         elif action == 'betpot':
             self.handle_betpot()
-            self.players[self.current_player]['acted'] = True
+        else:
+            return
+        p = self.current_player
+        if self.bets[p] > self.max_bet:
+            self.max_bet = self.bets[p]
+        if not self.acted[p]:
+            self.acted[p] = True
+            i = bisect_left(self.action_order, p)
+            if i < len(self.action_order) and self.action_order[i] == p:
+                self.unacted_count -= 1
+
+        # Drop the player from the action order once they fold or go all-in
+        if (self.status[p] != ACTIVE or self.allin[p]) and p in self.action_order:
+            self.action_order.remove(p)
     
     def deal_flop(self):
         """Deal the flop (3 community cards)"""
-        self.community_cards.append(self.deal_card())
-        self.community_cards.append(self.deal_card())
-        self.community_cards.append(self.deal_card())
-        print("Dealing flop...")
+        self.community_cards += self.deal_cards(3)
+        if self.verbose:
+            print("Dealing flop...")
     
     def deal_turn(self):
         """Deal the turn (4th community card)"""
         self.community_cards.append(self.deal_card())
-        print("Dealing turn...")
+        if self.verbose:
+            print("Dealing turn...")
     
     def deal_river(self):
         """Deal the river (5th community card)"""
         self.community_cards.append(self.deal_card())
-        print("Dealing river...")
+        if self.verbose:
+            print("Dealing river...")
     
     def showdown(self):
         """Evaluate hands and determine winners"""
-        print("SHOWDOWN")
-        for p in self.players:
-            p['acted'] = True
-
-        if len(self.players) > 2:
-            print('Still need to add logic for 3+ player hand evaluation at showdown!')
-            for p in self.players:
-                p['stack'] = Decimal('10.00')
-                p['acted'] = True
+        if self.verbose:
+            print("SHOWDOWN")
+        n = len(self.stacks)
+        self.acted = [True] * n
+        self.unacted_count = 0
+
+        if n > 2:
+            if self.verbose:
+                print('Still need to add logic for 3+ player hand evaluation at showdown!')
+            self.stacks = [10 * BB] * n
             return
         
         else:
-            winners_of_hi, winning_hi_hands = handEvaluator.evalHi(self.get_game_state())    #returns list of players with winning hand, and the winning hands
-            winners_of_lo, winning_lo_hands = handEvaluator.evalLo(self.get_game_state())    #returns [], [] if there are no low hands made, otherwise same as ^^
-            print(f"Community cards: {self.community_cards}")
-            print(f"Players: {self.players}")
-            print("Player(s) winning hi:")
-            for p, hand in zip(winners_of_hi, winning_hi_hands):
-                print(f"Seat {p['seat']} wins with {hand}")
-            print("Player(s) winning lo:")    
-            for p, hand in zip(winners_of_lo, winning_lo_hands):
-                print(f"Seat {p['seat']} wins with {hand}")
+            state = self.get_game_state()
+            winners_of_hi, winning_hi_hands = handEvaluator.evalHi(state)    #returns list of players with winning hand, and the winning hands
+            winners_of_lo, winning_lo_hands = handEvaluator.evalLo(state)    #returns [], [] if there are no low hands made, otherwise same as ^^
+            if self.verbose:
+                print(f"Community cards: {state['community_cards']}")
+                print(f"Players: {state['players']}")
+                print("Player(s) winning hi:")
+                for p, hand in zip(winners_of_hi, winning_hi_hands):
+                    print(f"Seat {p['seat']} wins with {hand}")
+                print("Player(s) winning lo:")
+                for p, hand in zip(winners_of_lo, winning_lo_hands):
+                    print(f"Seat {p['seat']} wins with {hand}")
             if winners_of_lo == []:
                 if len(winners_of_hi) == 1:
-                    self.players[winners_of_hi[0]['seat']]['stack'] += self.pot
+                    self.stacks[self.seats.index(winners_of_hi[0]['seat'])] += self.pot
                 else:
-                    split = self.q(self.pot / Decimal("2"))
-                    self.players[winners_of_hi[0]['seat']]['stack'] += split
-                    self.players[winners_of_hi[1]['seat']]['stack'] += self.pot - split
+                    split = (self.pot + 1) // 2
+                    self.stacks[self.seats.index(winners_of_hi[0]['seat'])] += split
+                    self.stacks[self.seats.index(winners_of_hi[1]['seat'])] += self.pot - split
             else:
-                lo_share = self.q(self.pot / Decimal("2"))
+                lo_share = (self.pot + 1) // 2
                 hi_share = self.pot - lo_share
                 if len(winners_of_hi) == 1:
-                    self.players[winners_of_hi[0]['seat']]['stack'] += hi_share
+                    self.stacks[self.seats.index(winners_of_hi[0]['seat'])] += hi_share
                 else:
-                    split = self.q(hi_share / Decimal("2"))
-                    self.players[winners_of_hi[0]['seat']]['stack'] += split
-                    self.players[winners_of_hi[1]['seat']]['stack'] += hi_share - split
+                    split = (hi_share + 1) // 2
+                    self.stacks[self.seats.index(winners_of_hi[0]['seat'])] += split
+                    self.stacks[self.seats.index(winners_of_hi[1]['seat'])] += hi_share - split
                 if len(winners_of_lo) == 1:
-                    self.players[winners_of_lo[0]['seat']]['stack'] += lo_share
+                    self.stacks[self.seats.index(winners_of_lo[0]['seat'])] += lo_share
                 else:
-                    split = self.q(lo_share / Decimal("2"))
-                    self.players[winners_of_lo[0]['seat']]['stack'] += split
-                    self.players[winners_of_lo[1]['seat']]['stack'] += lo_share - split
-            self.main_pot, self.pot = Decimal("0"), Decimal("0")
-            print(self.players)
+                    split = (lo_share + 1) // 2
+                    self.stacks[self.seats.index(winners_of_lo[0]['seat'])] += split
+                    self.stacks[self.seats.index(winners_of_lo[1]['seat'])] += lo_share - split
+            self.pot = 0
+            self.pots = [0] * N_POTS
+            self.state_version += 1
+            if self.verbose:
+                print(self.get_game_state()['players'])
             
                 
 
     def handle_checkfold(self):
         """Handle 0 bet (check or fold depending on gamestate)"""
+        p = self.current_player
         #find max bet
-        min_to_play = max(player['bet'] for player in self.players)
+        min_to_play = self.max_bet
 
         #determine if 0 bet is a check or fold
-        if self.players[self.current_player]['bet'] == min_to_play:
-            print(f"Player {self.current_player} checks")
+        if self.bets[p] == min_to_play:
+            if self.verbose:
+                print(f"Player {p} checks")
         else:
-            self.players[self.current_player]['status'] = 'folded'
-            #self.players[self.current_player]['cards'] = []
-            print(f"Player {self.current_player} folds")
+            self.status[p] = FOLDED
+            self.active_count -= 1
+            #self.cards[p] = []
+            if self.verbose:
+                print(f"Player {p} folds")
     
     def handle_callminbet(self):
         """Handle minimum bet (call or min bet depending on gamestate)"""
+        p = self.current_player
         #find max bet
-        min_to_play = max(player['bet'] for player in self.players)
-        current_bet = self.players[self.current_player]['bet']
+        min_to_play = self.max_bet
+        current_bet = self.bets[p]
 
         #min bet is 1bb
-        if min_to_play == Decimal("0.00"):
+        if min_to_play == 0:
             #not all in
-            if self.players[self.current_player]['stack'] > Decimal("1.00"):
-                self.players[self.current_player]['bet'] = Decimal("1.00")
-                added = Decimal("1.00") - current_bet
-                self.players[self.current_player]['stack'] -= added
-                self.players[self.current_player]['contrib'] += added
+            if self.stacks[p] > BB:
+                self.bets[p] = BB
+                added = BB - current_bet
+                self.stacks[p] -= added
+                self.contribs[p] += added
                 self.pot += added
-                for player in self.players:
-                    player['acted'] = False
-                print(f"Player {self.current_player} bets 1bb")
+                self.reopen_action()
+                if self.verbose:
+                    print(f"Player {p} bets 1bb")
             #all in
             else:
-                added = self.players[self.current_player]['stack']
-                self.players[self.current_player]['bet'] += added
-                self.players[self.current_player]['contrib'] += added
-                self.players[self.current_player]['stack'] = Decimal("0.00")
+                added = self.stacks[p]
+                self.bets[p] += added
+                self.contribs[p] += added
+                self.stacks[p] = 0
                 self.pot += added
-                self.players[self.current_player]['allin'] = True
-                for player in self.players:
-                    player['acted'] = False
-                print(f"Player {self.current_player} goes all in with {self.players[self.current_player]['bet']}bb")
+                self.allin[p] = True
+                self.reopen_action()
+                if self.verbose:
+                    print(f"Player {p} goes all in with {self.bets[p] / 100:.2f}bb")
         #min bet is a call
         else:
-            to_call = self.q(min_to_play - current_bet)
+            to_call = min_to_play - current_bet
             #not all in
-            if self.players[self.current_player]['stack'] > to_call:
-                self.players[self.current_player]['bet'] = self.q(min_to_play)
-                self.players[self.current_player]['stack'] -= to_call
-                self.players[self.current_player]['contrib'] += to_call
+            if self.stacks[p] > to_call:
+                self.bets[p] = min_to_play
+                self.stacks[p] -= to_call
+                self.contribs[p] += to_call
                 self.pot += to_call
-                print(f"Player {self.current_player} calls {min_to_play}bb")
+                if self.verbose:
+                    print(f"Player {p} calls {min_to_play / 100:.2f}bb")
             #all in
             else:
-                added = self.players[self.current_player]['stack']
-                self.players[self.current_player]['bet'] += added
-                self.players[self.current_player]['contrib'] += added
+                added = self.stacks[p]
+                self.bets[p] += added
+                self.contribs[p] += added
                 self.pot += added
-                self.players[self.current_player]['stack'] = Decimal("0.00")
-                self.players[self.current_player]['allin'] = True
-                print(f"Player {self.current_player} goes all in with {self.players[self.current_player]['bet']}bb")
+                self.stacks[p] = 0
+                self.allin[p] = True
+                if self.verbose:
+                    print(f"Player {p} goes all in with {self.bets[p] / 100:.2f}bb")
     
     def handle_bethalfpot(self):
         """Handle 1/2 pot bet"""
+        p = self.current_player
         #find max bet // amount to call
-        min_to_play = max(player['bet'] for player in self.players)
-        current_bet = self.players[self.current_player]['bet']
-        pot = (self.pot - current_bet) + (Decimal("2.00") * min_to_play)
-        pot12 = (Decimal("0.5") * pot).quantize(CENTS)
-        if pot12 < Decimal("2.00"): pot12 = Decimal("2.00")     #min allowed bet preflop that's not a call
+        min_to_play = self.max_bet
+        current_bet = self.bets[p]
+        pot = (self.pot - current_bet) + (2 * min_to_play)
+        pot12 = (pot + 1) // 2      # half pot, half a cent rounds up
+        if pot12 < MIN_BET: pot12 = MIN_BET     #min allowed bet preflop that's not a call
 
         #not all in
-        amount_needed = self.q(pot12 - current_bet)
-        if self.players[self.current_player]['stack'] > amount_needed:
-            self.players[self.current_player]['bet'] = self.q(pot12)
-            self.players[self.current_player]['stack'] -= amount_needed
-            self.players[self.current_player]['contrib'] += amount_needed
+        amount_needed = pot12 - current_bet
+        if self.stacks[p] > amount_needed:
+            self.bets[p] = pot12
+            self.stacks[p] -= amount_needed
+            self.contribs[p] += amount_needed
             self.pot += amount_needed
-            for player in self.players:
-                    player['acted'] = False
-            print(f"Player {self.current_player} bets 1/2 pot: {pot12}bb")
+            self.reopen_action()
+            if self.verbose:
+                print(f"Player {p} bets 1/2 pot: {pot12 / 100:.2f}bb")
         #all in
         else:
-            added = self.players[self.current_player]['stack']
-            self.players[self.current_player]['bet'] += added
-            self.players[self.current_player]['contrib'] += added
+            added = self.stacks[p]
+            self.bets[p] += added
+            self.contribs[p] += added
             self.pot += added
-            self.players[self.current_player]['stack'] = Decimal("0.00")
-            self.players[self.current_player]['allin'] = True
-            if self.players[self.current_player]['bet'] > min_to_play:
-                for player in self.players:
-                        player['acted'] = False
-            print(f"Player {self.current_player} goes all in with {self.players[self.current_player]['bet']}bb")
+            self.stacks[p] = 0
+            self.allin[p] = True
+            if self.bets[p] > min_to_play:
+                self.reopen_action()
+            if self.verbose:
+                print(f"Player {p} goes all in with {self.bets[p] / 100:.2f}bb")
         
     
     def handle_betthreequarterspot(self):
         """Handle 3/4 pot bet"""
+        p = self.current_player
         #find max bet // amount to call
-        min_to_play = max(player['bet'] for player in self.players)
-        current_bet = self.players[self.current_player]['bet']
-        pot = (self.pot - current_bet) + (Decimal("2.00") * min_to_play)
-        pot34 = (Decimal("0.75") * pot).quantize(CENTS)
-        if pot34 < Decimal("2.00"): pot34 = Decimal("2.00")     #min allowed bet preflop that's not a call
+        min_to_play = self.max_bet
+        current_bet = self.bets[p]
+        pot = (self.pot - current_bet) + (2 * min_to_play)
+        pot34 = (3 * pot + 2) // 4      # 3/4 pot, half a cent rounds up
+        if pot34 < MIN_BET: pot34 = MIN_BET     #min allowed bet preflop that's not a call
         
-        amount_needed = self.q(pot34 - current_bet)
+        amount_needed = pot34 - current_bet
         #not all in
-        if self.players[self.current_player]['stack'] > amount_needed:
-            self.players[self.current_player]['bet'] = self.q(pot34)
-            self.players[self.current_player]['stack'] -= amount_needed
-            self.players[self.current_player]['contrib'] += amount_needed
+        if self.stacks[p] > amount_needed:
+            self.bets[p] = pot34
+            self.stacks[p] -= amount_needed
+            self.contribs[p] += amount_needed
             self.pot += amount_needed
-            for player in self.players:
-                    player['acted'] = False
-            print(f"Player {self.current_player} bets 3/4 pot: {pot34}bb")
+            self.reopen_action()
+            if self.verbose:
+                print(f"Player {p} bets 3/4 pot: {pot34 / 100:.2f}bb")
         #all in
         else:
-            added = self.players[self.current_player]['stack']
-            self.players[self.current_player]['bet'] += added
-            self.players[self.current_player]['contrib'] += added
+            added = self.stacks[p]
+            self.bets[p] += added
+            self.contribs[p] += added
             self.pot += added
-            self.players[self.current_player]['stack'] = Decimal("0.00")
-            self.players[self.current_player]['allin'] = True
-            if self.players[self.current_player]['bet'] > min_to_play:
-                for player in self.players:
-                        player['acted'] = False
-            print(f"Player {self.current_player} goes all in with {self.players[self.current_player]['bet']}bb")
+            self.stacks[p] = 0
+            self.allin[p] = True
+            if self.bets[p] > min_to_play:
+                self.reopen_action()
+            if self.verbose:
+                print(f"Player {p} goes all in with {self.bets[p] / 100:.2f}bb")
     
     def handle_betpot(self):
         """Handle pot bet"""
+        p = self.current_player
         #find max bet // amount to call
-        min_to_play = max(player['bet'] for player in self.players)
-        current_bet = self.players[self.current_player]['bet']
-        pot = (self.pot - current_bet) + (Decimal("2.00") * min_to_play)
-        pot = pot.quantize(CENTS)
+        min_to_play = self.max_bet
+        current_bet = self.bets[p]
+        pot = (self.pot - current_bet) + (2 * min_to_play)
 
-        amount_needed = self.q(pot - current_bet)
+        amount_needed = pot - current_bet
         #not all in
-        if self.players[self.current_player]['stack'] > amount_needed:
-            self.players[self.current_player]['bet'] = self.q(pot)
-            self.players[self.current_player]['stack'] -= amount_needed
-            self.players[self.current_player]['contrib'] += amount_needed
+        if self.stacks[p] > amount_needed:
+            self.bets[p] = pot
+            self.stacks[p] -= amount_needed
+            self.contribs[p] += amount_needed
             self.pot += amount_needed
-            for player in self.players:
-                    player['acted'] = False
-            print(f"Player {self.current_player} bets pot: {pot}bb")
+            self.reopen_action()
+            if self.verbose:
+                print(f"Player {p} bets pot: {pot / 100:.2f}bb")
         #all in
         else:
-            added = self.players[self.current_player]['stack']
-            self.players[self.current_player]['bet'] += added
-            self.players[self.current_player]['contrib'] += added
+            added = self.stacks[p]
+            self.bets[p] += added
+            self.contribs[p] += added
             self.pot += added
-            self.players[self.current_player]['stack'] = Decimal("0.00")
-            self.players[self.current_player]['allin'] = True
-            if self.players[self.current_player]['bet'] > min_to_play:
-                for player in self.players:
-                        player['acted'] = False
-            print(f"Player {self.current_player} goes all in with {self.players[self.current_player]['bet']}bb")
+            self.stacks[p] = 0
+            self.allin[p] = True
+            if self.bets[p] > min_to_play:
+                self.reopen_action()
+            if self.verbose:
+                print(f"Player {p} goes all in with {self.bets[p] / 100:.2f}bb")
 
     def init_deck(self):
-        self.deck = [
-            'C2', 'D2', 'S2', 'H2',
-            'C3', 'D3', 'S3', 'H3',
-            'C4', 'D4', 'S4', 'H4',
-            'C5', 'D5', 'S5', 'H5',
-            'C6', 'D6', 'S6', 'H6',
-            'C7', 'D7', 'S7', 'H7',
-            'C8', 'D8', 'S8', 'H8',
-            'C9', 'D9', 'S9', 'H9',
-            'CT', 'DT', 'ST', 'HT',
-            'CJ', 'DJ', 'SJ', 'HJ',
-            'CQ', 'DQ', 'SQ', 'HQ',
-            'CK', 'DK', 'SK', 'HK',
-            'CA', 'DA', 'SA', 'HA'
-        ]
-        random.shuffle(self.deck)
-        random.shuffle(self.deck)   # shuffle twice for good measure
-        self.deck.reverse()
+        """Build and shuffle a fresh deck of card ints (see handEvaluator.CARDS for the encoding)"""
+        self.rng.shuffle(self.deck_buffer)
+        self.deck = self.deck_buffer.tolist()
+        self.deck_idx = 0   # cursor to the next card to deal
 
     def deal_card(self):
-        return self.deck.pop()
+        """Deal one card int off the deck"""
+        card = self.deck[self.deck_idx]
+        self.deck_idx += 1
+        return card
+
+    def deal_cards(self, count):
+        """Deal the next count card ints off the deck as one slice"""
+        start = self.deck_idx
+        self.deck_idx = start + count
+        return self.deck[start:start + count]
@@ -42,6 +42,7 @@ class CardRenderer:
         self.suit_font = pygame.font.SysFont('arial', 42)
         self.rank_font_scaled = pygame.font.SysFont('arial', 63, bold=True)
         self.suit_font_scaled = pygame.font.SysFont('arial', 63)
+        self.logo_font = pygame.font.SysFont('arial', 56, bold=False)
 
         # Colors
         self.WHITE = (250, 250, 250)
@@ -52,6 +53,14 @@ class CardRenderer:
         self.GREEN = (50, 159, 40)
         self.CARD_BACK_COLOR = (30, 30, 30)
         self.CARD_BACK_BORDER = (180, 80, 80)
+
+        # Rendered cards, keyed by (card, face_up, scaled)
+        self.card_cache = {}
+
+        # Rendered 4-card hole strips, keyed by the card tuple (None = card back)
+        self.strip_cache = {}
+        self.STRIP_CACHE_SIZE = 256
+        self.strip_spacing = -4
     
     def render_card(self, card, face_up: bool = True, scaled: bool = False) -> pygame.Surface:
         """
@@ -63,8 +72,14 @@ class CardRenderer:
             face_up: Whether to show the face or back
         
         Returns:
-            pygame.Surface of the rendered card
+            pygame.Surface of the rendered card (shared, do not draw on it)
         """
+        # All card backs look the same
+        key = (card if face_up else None, face_up, scaled)
+        card_surface = self.card_cache.get(key)
+        if card_surface is not None:
+            return card_surface
+
         # Create card surface
         if scaled:
             card_surface = pygame.Surface((1.5*self.card_width, 1.5*self.card_height), pygame.SRCALPHA)
@@ -85,9 +100,41 @@ class CardRenderer:
         else:
             pygame.draw.rect(card_surface, border_color, 
                         (0, 0, self.card_width, self.card_height), 4, border_radius=self.card_radius)
-        
+
+        # Match the display pixel format so blits are a straight copy
+        if pygame.display.get_surface() is not None:
+            card_surface = card_surface.convert_alpha()
+        self.card_cache[key] = card_surface
         return card_surface
     
+    def render_hole_strip(self, cards: tuple) -> pygame.Surface:
+        """
+        Render a player's hole cards side by side as one surface
+        
+        Args:
+            cards: Tuple of card strings, with None for a card shown face down
+        
+        Returns:
+            pygame.Surface of the overlapping cards (shared, do not draw on it)
+        """
+        strip_surface = self.strip_cache.get(cards)
+        if strip_surface is not None:
+            return strip_surface
+
+        step = self.card_width + self.strip_spacing
+        strip_surface = pygame.Surface((step * (len(cards) - 1) + self.card_width, self.card_height), pygame.SRCALPHA)
+        for i, card in enumerate(cards):
+            card_surface = self.render_card(card, face_up=card is not None, scaled=False)
+            strip_surface.blit(card_surface, (i * step, 0))
+
+        if pygame.display.get_surface() is not None:
+            strip_surface = strip_surface.convert_alpha()
+        # Every hand brings new strips, so drop old entries now and then
+        if len(self.strip_cache) >= self.STRIP_CACHE_SIZE:
+            self.strip_cache.clear()
+        self.strip_cache[cards] = strip_surface
+        return strip_surface
+    
     def _parse_card(self, card_str: str) -> tuple:
         """
         Parse card string like 'HA', 'D10', 'CK' into suit and rank
@@ -168,13 +215,21 @@ class CardRenderer:
         )
         
         # Card back design (simple "?" like current design)
-        logo_font = pygame.font.SysFont('arial', 56, bold=False)
-        logo = logo_font.render("?", True, self.CARD_BACK_BORDER)
+        logo = self.logo_font.render("?", True, self.CARD_BACK_BORDER)
         logo_rect = logo.get_rect(center=(self.card_width//2, self.card_height//2))
         surface.blit(logo, logo_rect)
 
 
 class Render:
+    # 5 Allowed Actions at any decision point in PLO8: (label, color, hover color, action)
+    ACTION_BUTTONS = [
+        ("CHECK / FOLD", (108, 18, 18), (158, 68, 68), "check/fold"),
+        ("CALL / BET MIN", (108, 59, 18), (158, 109, 68), "call/minbet"),
+        ("BET 1/2 POT", (108, 108, 18), (158, 158, 68), "bet1/2pot"),
+        ("BET 3/4 POT", (60, 108, 18), (110, 158, 68), "bet3/4pot"),
+        ("BET POT", (14, 108, 18), (74, 158, 68), "betpot"),
+    ]
+
     def __init__(self, settings):
         """Initialize pygame and rendering components"""
         pygame.init()
@@ -203,8 +258,14 @@ class Render:
         self.WIDTH = display_info.current_w
         self.HEIGHT = display_info.current_h - 50
         
-        # Create window
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
+        # Create window, through SDL's renderer with vsync where the platform allows it
+        flags = pygame.RESIZABLE | pygame.DOUBLEBUF | pygame.SCALED
+        try:
+            self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), flags, vsync=1)
+            self.scaled = True
+        except pygame.error:
+            self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
+            self.scaled = False
         pygame.display.set_caption("PLO8 Training Sandbox")
 
         try:
@@ -215,6 +276,11 @@ class Render:
             pass
         
         self.clock = pygame.time.Clock()
+
+        # Frame rates: while dragging the slider, after drawing a changed frame, and while nothing changes
+        self.DRAG_FPS = 60
+        self.FPS = 30
+        self.IDLE_FPS = 10
         
         # Initialize card renderer
         self.card_renderer = CardRenderer(card_width=70, card_height=100)
@@ -252,22 +318,77 @@ class Render:
         self.tiny_font = pygame.font.SysFont('arial', 16)
         self.stack_font = pygame.font.SysFont('arial', 24, bold=True)
         self.pot_font = pygame.font.SysFont('arial', 28, bold=True)
+        self.dealer_font = pygame.font.SysFont('arial', 32, bold=True)
+        self.seat_num_font = pygame.font.SysFont('arial', 28, bold=True)
+        self.stack_big_font = pygame.font.SysFont('arial', 40, bold=True)
+        self.bet_font = pygame.font.SysFont('arial', 32, bold=True)
+        self.label_font = pygame.font.SysFont('arial', 20, bold=True)
+        self.value_font = pygame.font.SysFont('arial', 18)
+
+        # Rendered text, keyed by (font, text, color)
+        self.text_cache = {}
+        self.TEXT_CACHE_SIZE = 512
         
         # Mouse state
         self.mouse_pos = (0, 0)
-        
-        # Button bounds for click detection
-        self.button_bounds = {}
+
+        # Only queue the events get_user_input handles; mouse motion is let
+        # through while the perspective slider is being dragged
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE,
+                                  pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP])
+        
+        # Action buttons as (x, y, w, h, action, label, color, hover color), laid out per window size
+        self.button_list = []
 
         self.perspective = 0  # 0 = all cards, 1-9 = that player's cards only
         self.perspective_slider_bounds = None
         self.dragging_perspective = False
+
+        # Background, table and panel art, rebuilt when the window size changes
+        self.background = None
+        self.bg_size = None
+
+        # Seat layouts, keyed by (width, height, num_players)
+        self.seat_positions_cache = {}
+
+        # Translucent bet chip backgrounds, keyed by (width, height)
+        self.bet_chip_cache = {}
+
+        # Static seat art
+        self.dealer_coin_surf = self._build_dealer_coin()
+        self.vacant_seat_surf = self._build_vacant_seat()
+        self._build_info_box_art()
+
+        # Everything the last frame depended on, to skip redrawing an unchanged frame
+        self.last_frame_key = None
+
+        # Screen areas drawn over the background this frame and last frame; only these are
+        # sent to the display on the plain window. A SCALED window presents its whole
+        # texture on every update, so it always flips
+        self.dirty_rects = []
+        self.last_dirty_rects = []
+    
+    def _render_text(self, font, text, color):
+        """Render antialiased text, reusing the surface if it was drawn before"""
+        key = (font, text, color)
+        text_surface = self.text_cache.get(key)
+        if text_surface is None:
+            # Stack and pot strings keep changing, so drop old entries now and then
+            if len(self.text_cache) >= self.TEXT_CACHE_SIZE:
+                self.text_cache.clear()
+            text_surface = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = text_surface
+        return text_surface
     
     def get_user_input(self):
         """
         Handle pygame events and return user actions
         Returns: dict with action type or None
         """
+        # Hover is read once here rather than from every motion event
+        self.mouse_pos = pygame.mouse.get_pos()
+
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return 'quit'
@@ -276,19 +397,29 @@ class Render:
                 if event.key == pygame.K_ESCAPE:
                     return 'quit'
             
+            elif event.type == pygame.VIDEORESIZE:
+                # With SCALED the window stretches and the drawing size stays put
+                self.WIDTH, self.HEIGHT = self.screen.get_size()
+            
+            elif event.type == pygame.VIDEOEXPOSE:
+                # Window contents were lost, draw the next frame even if unchanged
+                self.last_frame_key = None
+            
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     # Check perspective slider first
                     if self._check_perspective_slider_click(event.pos):
                         self.dragging_perspective = True
+                        pygame.event.set_allowed(pygame.MOUSEMOTION)
                     else:
                         action = self._handle_mouse_click(event.pos)
                         if action:
                             return action
             
             elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:
+                if event.button == 1 and self.dragging_perspective:
                     self.dragging_perspective = False
+                    pygame.event.set_blocked(pygame.MOUSEMOTION)
             
             elif event.type == pygame.MOUSEMOTION:
                 self.mouse_pos = event.pos
@@ -301,11 +432,10 @@ class Render:
         """Check if any button was clicked and return corresponding action"""
         x, y = pos
         
-        for button_id, bounds in self.button_bounds.items():
-            bx, by, bw, bh = bounds
+        for bx, by, bw, bh, action, *_ in self.button_list:
             if bx <= x <= bx + bw and by <= y <= by + bh:
                 # Button was clicked
-                return button_id
+                return action
         
         return None
     
@@ -328,16 +458,15 @@ class Render:
         x, y = pos
         sx, sy, width, height = self.perspective_slider_bounds
         
-        # Clamp mouse position to slider bounds
-        x = max(sx, min(x, sx + width))
+        # Clamp mouse offset to slider bounds
+        dx = x - sx
+        if dx < 0:
+            dx = 0
+        elif dx > width:
+            dx = width
         
-        # Calculate ratio
-        ratio = (x - sx) / width
-        
-        # Calculate new value (0-9)
-        new_val = int(ratio * 9)
-        
-        self.perspective = max(0, min(new_val, 9))
+        # Calculate new value (0-9) in integers
+        self.perspective = dx * 9 // width
     
     def render(self, game_state):
         """
@@ -349,15 +478,31 @@ class Render:
                     'players': list of player dicts,
                     'pot': int,
                     'main_pot': int,
+                    'side_pots': tuple of 8 side pot sizes,
                     'community_cards': list,
                     'dealer_position': int,
                     'current_player': int,
                 }
+            Cards, in 'cards' of each player and in 'community_cards', are either
+            card strings like 'HA' or 'D10', or None for no card.
         """
-        self.screen.fill(self.BG_COLOR)
-        
-        # Draw table
-        self.draw_poker_table()
+        # The controller hands back the same state object until the game changes,
+        # so this is normally an identity check
+        frame_key = (game_state, self.perspective, self.dragging_perspective,
+                     self._handle_mouse_click(self.mouse_pos), self.WIDTH, self.HEIGHT)
+        if frame_key == self.last_frame_key:
+            self.clock.tick(self.IDLE_FPS)
+            return
+        full_update = self.last_frame_key is None
+        self.last_frame_key = frame_key
+
+        if self.bg_size != (self.WIDTH, self.HEIGHT):
+            self.build_background()
+            self.build_layout()
+            full_update = True
+
+        # Draw background, table and panel
+        self.screen.blit(self.background, (0, 0))
         
         # Draw pot info
         self.draw_pot_info(game_state)
@@ -371,12 +516,22 @@ class Render:
         # Draw control panel
         self.draw_control_panel()
         
-        # Update display
-        pygame.display.flip()
-        self.clock.tick(30)  # 30 FPS
+        # Update display; outside the areas drawn now or last frame the screen still shows the background
+        if full_update or self.scaled:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.last_dirty_rects + self.dirty_rects)
+        self.last_dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        self.clock.tick(self.DRAG_FPS if self.dragging_perspective else self.FPS)
     
     def get_seat_positions(self, num_players):
-        """Calculate seat positions around the table"""
+        """Calculate seat positions around the table, once per window size and player count"""
+        key = (self.WIDTH, self.HEIGHT, num_players)
+        positions = self.seat_positions_cache.get(key)
+        if positions is not None:
+            return positions
+
         center_x = self.WIDTH // 2
         center_y = self.HEIGHT // 2 - 120
         table_width = min(self.WIDTH * 0.7, 1100)
@@ -488,10 +643,14 @@ class Render:
                 'bet_offset': bet_offset,
             })
         
+        self.seat_positions_cache[key] = positions
         return positions
     
-    def draw_poker_table(self):
-        """Draw the rounded rectangle poker table"""
+    def build_background(self):
+        """Draw the background, poker table and control panel once for the current window size"""
+        self.background = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+        self.background.fill(self.BG_COLOR)
+
         center_x = self.WIDTH // 2
         center_y = self.HEIGHT // 2 - 120
         
@@ -507,7 +666,7 @@ class Render:
             table_width + 20, 
             table_height + 20
         )
-        pygame.draw.rect(self.screen, self.PANEL_COLOR, outer_rect, border_radius=corner_radius + 8)
+        pygame.draw.rect(self.background, self.PANEL_COLOR, outer_rect, border_radius=corner_radius + 8)
         
         # Inner felt
         inner_rect = pygame.Rect(
@@ -516,18 +675,26 @@ class Render:
             table_width, 
             table_height
         )
-        pygame.draw.rect(self.screen, self.BG_COLOR, inner_rect, border_radius=corner_radius)
+        pygame.draw.rect(self.background, self.BG_COLOR, inner_rect, border_radius=corner_radius)
+
+        # Control panel
+        panel_height = 230
+        panel_y = self.HEIGHT - panel_height
+        pygame.draw.rect(self.background, (50, 50, 50),
+                        (0, panel_y, self.WIDTH, panel_height))
+        pygame.draw.line(self.background, (80, 80, 80),
+                        (0, panel_y), (self.WIDTH, panel_y), 3)
+
+        self.bg_size = (self.WIDTH, self.HEIGHT)
     
     def draw_pot_info(self, game_state):
         """Draw pot information in center of table"""
         center_x = self.WIDTH // 2
         center_y = self.HEIGHT // 2 - 242
-        pot, main_pot, side_pot = game_state.get('pot'), game_state.get('main_pot'), game_state.get('side_pot')
-        side_pot1, side_pot2, side_pot3 = game_state.get('side_pot1'), game_state.get('side_pot2'), game_state.get('side_pot3')
-        side_pot4, side_pot5, side_pot6, side_pot7 = game_state.get('side_pot4'), game_state.get('side_pot5'), game_state.get('side_pot6'), game_state.get('side_pot7')
+        pot, main_pot, side_pots = game_state.get('pot'), game_state.get('main_pot'), game_state.get('side_pots', ())
         # Total pot
         pot_text = f"Total pot: {pot:,} bb"
-        pot_surface = self.pot_font.render(pot_text, True, self.WHITE)
+        pot_surface = self._render_text(self.pot_font, pot_text, self.WHITE)
         pot_rect = pot_surface.get_rect(center=(center_x, center_y))
         
         # Background
@@ -535,149 +702,102 @@ class Render:
         pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
         pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
         self.screen.blit(pot_surface, pot_rect)
+        self.dirty_rects.append(bg_rect)
         
         # Render no other pots
-        if main_pot == pot:
+        n_side = max((i + 1 for i, side_pot in enumerate(side_pots) if side_pot), default=0)
+        if main_pot == pot or not (main_pot or n_side):
             return
-        # Render main pot, 8 side pots
-        elif side_pot6:
-            main_text = f"Main pot:{main_pot:,} bb, Side pot: {side_pot:,} bb, +1: {side_pot1:,} bb, +2: {side_pot2:,} bb, +3: {side_pot3:,} bb, +4: {side_pot4:,} bb, +5: {side_pot5:,} bb, +6: {side_pot6:,} bb, +7: {side_pot7:,} bb"
-            main_surface = self.small_font.render(main_text, True, self.WHITE)
-            main_rect = main_surface.get_rect(center=(center_x, center_y + 38))
-            bg_rect = main_rect.inflate(20, 6)
-            pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
-            pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
-            self.screen.blit(main_surface, main_rect)
-        # Render main pot, 7 side pots
-        elif side_pot6:
-            main_text = f"Main pot:{main_pot:,} bb, Side pot: {side_pot:,} bb, +1: {side_pot1:,} bb, +2: {side_pot2:,} bb, +3: {side_pot3:,} bb, +4: {side_pot4:,} bb, +5: {side_pot5:,} bb, +6: {side_pot6:,} bb"
-            main_surface = self.small_font.render(main_text, True, self.WHITE)
-            main_rect = main_surface.get_rect(center=(center_x, center_y + 38))
-            bg_rect = main_rect.inflate(20, 6)
-            pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
-            pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
-            self.screen.blit(main_surface, main_rect)
-        # Render main pot, 6 side pots
-        elif side_pot5:
-            main_text = f"Main pot:{main_pot:,} bb, Side pot: {side_pot:,} bb, +1: {side_pot1:,} bb, +2: {side_pot2:,} bb, +3: {side_pot3:,} bb, +4: {side_pot4:,} bb, +5: {side_pot5:,} bb"
-            main_surface = self.small_font.render(main_text, True, self.WHITE)
-            main_rect = main_surface.get_rect(center=(center_x, center_y + 38))
-            bg_rect = main_rect.inflate(20, 6)
-            pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
-            pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
-            self.screen.blit(main_surface, main_rect)
-        # Render main pot, 5 side pots
-        elif side_pot4:
-            main_text = f"Main pot:{main_pot:,} bb, Side pot: {side_pot:,} bb, +1: {side_pot1:,} bb, +2: {side_pot2:,} bb, +3: {side_pot3:,} bb, +4: {side_pot4:,} bb"
-            main_surface = self.small_font.render(main_text, True, self.WHITE)
-            main_rect = main_surface.get_rect(center=(center_x, center_y + 38))
-            bg_rect = main_rect.inflate(20, 6)
-            pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
-            pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
-            self.screen.blit(main_surface, main_rect)
-        # Render main pot, 4 side pots
-        elif side_pot3:
-            main_text = f"Main pot:{main_pot:,} bb, Side pot: {side_pot:,} bb, +1: {side_pot1:,} bb, +2: {side_pot2:,} bb, +3: {side_pot3:,} bb"
-            main_surface = self.small_font.render(main_text, True, self.WHITE)
-            main_rect = main_surface.get_rect(center=(center_x, center_y + 38))
-            bg_rect = main_rect.inflate(20, 6)
-            pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
-            pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
-            self.screen.blit(main_surface, main_rect)
-        # Render main pot, 3 side pots
-        elif side_pot2:
-            main_text = f"Main pot:{main_pot:,} bb, Side pot: {side_pot:,} bb, +1: {side_pot1:,} bb, +2: {side_pot2:,} bb"
-            main_surface = self.small_font.render(main_text, True, self.WHITE)
-            main_rect = main_surface.get_rect(center=(center_x, center_y + 38))
-            bg_rect = main_rect.inflate(20, 6)
-            pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
-            pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
-            self.screen.blit(main_surface, main_rect)
-        # Render main pot, 2 side pots
-        elif side_pot1:
-            main_text = f"Main pot:{main_pot:,} bb, Side pot: {side_pot:,} bb, +1: {side_pot1:,} bb"
-            main_surface = self.small_font.render(main_text, True, self.WHITE)
-            main_rect = main_surface.get_rect(center=(center_x, center_y + 38))
-            bg_rect = main_rect.inflate(20, 6)
-            pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
-            pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
-            self.screen.blit(main_surface, main_rect)
-        # Render main pot, 1 side pots
-        elif side_pot:
-            main_text = f"Main pot:{main_pot:,} bb, Side pot: {side_pot:,} bb"
-            main_surface = self.small_font.render(main_text, True, self.WHITE)
-            main_rect = main_surface.get_rect(center=(center_x, center_y + 38))
-            bg_rect = main_rect.inflate(20, 6)
-            pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
-            pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
-            self.screen.blit(main_surface, main_rect)
-        # Render main pot
-        elif main_pot:
-            main_text = f"Main pot:{main_pot:,} bb"
-            main_surface = self.small_font.render(main_text, True, self.WHITE)
-            main_rect = main_surface.get_rect(center=(center_x, center_y + 38))
-            bg_rect = main_rect.inflate(20, 6)
-            pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
-            pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
-            self.screen.blit(main_surface, main_rect)
+        # Render main pot, then side pots up to the last non-empty one
+        main_text = f"Main pot:{main_pot:,} bb"
+        if n_side:
+            main_text += f", Side pot: {side_pots[0]:,} bb"
+        for i in range(1, n_side):
+            main_text += f", +{i}: {side_pots[i]:,} bb"
+        main_surface = self._render_text(self.small_font, main_text, self.WHITE)
+        main_rect = main_surface.get_rect(center=(center_x, center_y + 38))
+        bg_rect = main_rect.inflate(20, 6)
+        pygame.draw.rect(self.screen, (60, 60, 60), bg_rect, border_radius=5)
+        pygame.draw.rect(self.screen, (90, 90, 90), bg_rect, 1, border_radius=5)
+        self.screen.blit(main_surface, main_rect)
+        self.dirty_rects.append(bg_rect)
     
     def draw_players(self, game_state):
+        """Draw each player seat with cards, stack, and bet"""
         players = game_state.get('players')
         positions = self.get_seat_positions(len(players))
+        seat_to_player = {player['seat']: player for player in players}
+        current_player = game_state.get('current_player')
+        dealer_position = game_state.get('dealer_position')
         for i, pos in enumerate(positions):
-            for player in players:
-                if player['seat'] == i:
-                    """Draw a single player seat with cards, stack, and bet"""
-                    x, y = pos['x'], pos['y']
-                    side = pos['side']
-                    # Draw cards
-                    card_x = x - 134
-                    if side:
-                        card_y = y - 130
-                    else:
-                        card_y = y + 64
-                    self.draw_hole_cards(card_x, card_y, player)
-                    
-                    # Draw player info box
-                    self.draw_player_info_box(x, y, player, i, game_state.get('current_player'))
-
-                    # Draw dealer coin
-                    if game_state.get('dealer_position') == player['seat']:
-                        self.draw_dealer_coin(x - 130, y - 30)
-                    
-                    # Draw bet
-                    if player['bet'] > 0:
-                        bet_x = x + pos['bet_offset'][0]
-                        bet_y = y + pos['bet_offset'][1]
-                        self.draw_bet_chip(bet_x, bet_y, player['bet'])
+            player = seat_to_player.get(i)
+            if player is None:
+                continue
+            x, y = pos['x'], pos['y']
+            side = pos['side']
+            # Draw cards
+            card_x = x - 134
+            if side:
+                card_y = y - 130
+            else:
+                card_y = y + 64
+            self.draw_hole_cards(card_x, card_y, player)
+            
+            # Draw player info box
+            self.draw_player_info_box(x, y, player, i, current_player)
 
-    def draw_dealer_coin(self, x, y):
-        """Draw the dealer button coin"""
+            # Draw dealer coin
+            if dealer_position == i:
+                self.draw_dealer_coin(x - 130, y - 30)
+            
+            # Draw bet
+            if player['bet'] > 0:
+                bet_x = x + pos['bet_offset'][0]
+                bet_y = y + pos['bet_offset'][1]
+                self.draw_bet_chip(bet_x, bet_y, player['bet'])
+
+    def _build_dealer_coin(self):
+        """Draw the dealer button coin onto its own surface"""
         # Coin dimensions
         coin_radius = 30
+        size = 2 * coin_radius + 1
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Outer circle (border) - white
-        pygame.draw.circle(self.screen, self.DARK_GRAY, (int(x), int(y)), coin_radius)
+        pygame.draw.circle(surface, self.DARK_GRAY, (coin_radius, coin_radius), coin_radius)
         
         # Inner circle - black background
-        pygame.draw.circle(self.screen, self.WHITE, (int(x), int(y)), coin_radius - 3)
+        pygame.draw.circle(surface, self.WHITE, (coin_radius, coin_radius), coin_radius - 3)
         
         # Draw "D" for dealer
-        dealer_font = pygame.font.SysFont('arial', 32, bold=True)
-        dealer_text = dealer_font.render("D", True, self.DARK_GRAY)
-        dealer_rect = dealer_text.get_rect(center=(x, y))
-        self.screen.blit(dealer_text, dealer_rect)
+        dealer_text = self.dealer_font.render("D", True, self.DARK_GRAY)
+        dealer_rect = dealer_text.get_rect(center=(coin_radius, coin_radius))
+        surface.blit(dealer_text, dealer_rect)
+        return surface.convert_alpha()
     
-    def draw_vacant_seat(self, x, y):
-        """Draw a vacant seat indicator"""
+    def _build_vacant_seat(self):
+        """Draw the vacant seat indicator onto its own surface"""
         radius = 50
-        pygame.draw.circle(self.screen, (60, 60, 60), (int(x), int(y)), radius)
+        size = 2 * radius + 1
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (60, 60, 60), (radius, radius), radius)
         
         # Person icon
-        pygame.draw.circle(self.screen, (140, 140, 140), (int(x), int(y) - 16), 20)
-        pygame.draw.ellipse(self.screen, (140, 140, 140), 
-                           (int(x) - 36, int(y) + 8, 72, 40))
-        pygame.draw.circle(self.screen, (100, 100, 100), (int(x), int(y)), radius, 3)
+        pygame.draw.circle(surface, (140, 140, 140), (radius, radius - 16), 20)
+        pygame.draw.ellipse(surface, (140, 140, 140), 
+                           (radius - 36, radius + 8, 72, 40))
+        pygame.draw.circle(surface, (100, 100, 100), (radius, radius), radius, 3)
+        return surface.convert_alpha()
+    
+    def draw_dealer_coin(self, x, y):
+        """Draw the dealer button coin centred on (x, y)"""
+        half = self.dealer_coin_surf.get_width() // 2
+        self.dirty_rects.append(self.screen.blit(self.dealer_coin_surf, (int(x) - half, int(y) - half)))
+    
+    def draw_vacant_seat(self, x, y):
+        """Draw a vacant seat indicator centred on (x, y)"""
+        half = self.vacant_seat_surf.get_width() // 2
+        self.dirty_rects.append(self.screen.blit(self.vacant_seat_surf, (int(x) - half, int(y) - half)))
     
     def draw_hole_cards(self, x, y, player):
         """Draw player's hole cards - using CardRenderer for string format cards like 'HA', 'D10'"""
@@ -686,110 +806,101 @@ class Render:
         if player.get('status') == 'folded':
             return
         
-        card_width = 70
-        card_spacing = -4
-        
         cards = player.get('cards', [None, None, None, None])
         
         # Determine if cards should be face up based on perspective setting
         # 0 = all face up, 1-9 = only that player's cards face up
         should_show_face_up = (self.perspective == 0) or (self.perspective -1 == player['seat'])
         
-        for i in range(4):
-            card_x = x + i * (card_width + card_spacing)
-            
-            # Check if we have a card string (e.g., 'HA', 'D10', 'CK')
-            card = cards[i] if i < len(cards) else None
-            has_card = card is not None and isinstance(card, str) and len(card) >= 2
-            
-            if has_card and should_show_face_up:
-                # Use CardRenderer to draw actual card from string
-                card_surface = self.card_renderer.render_card(card, face_up=True, scaled=False)
-                self.screen.blit(card_surface, (card_x, y))
-            else:
-                # Draw card back (placeholder)
-                card_surface = self.card_renderer.render_card(None, face_up=False, scaled=False)
-                self.screen.blit(card_surface, (card_x, y))
+        # Card backs (placeholder) for anything not shown, None marks a back
+        if should_show_face_up:
+            shown = tuple(cards[:4]) + (None,) * (4 - len(cards))
+        else:
+            shown = (None, None, None, None)
+
+        # All four cards come pre-composed as one cached strip
+        self.dirty_rects.append(self.screen.blit(self.card_renderer.render_hole_strip(shown), (x, y)))
     
-    def draw_player_info_box(self, x, y, player, seat_index, current_player):
-        """Draw player info box with seat number and stack"""
+    def _build_info_box_art(self):
+        """Draw the static parts of the player info box: capsules, current player glow, seat badges"""
         box_width = 260
         box_height = 84
-        
-        seat_color = self.SEAT_COLORS[seat_index % len(self.SEAT_COLORS)]
-        bg_color = (230, 230, 225)
-        if current_player == seat_index:
-            bg_color = (250, 250, 250)
-        
-        box_x = x - box_width // 2
-        box_y = y - box_height // 2
-        
-        # Background
-        pygame.draw.rect(self.screen, bg_color,
-                        (box_x, box_y, box_width, box_height),
-                        border_radius=box_height // 2, )
-        
-        # Border gradient on current player
-        if seat_index == current_player:
-            border_surf = pygame.Surface((box_width+8, box_height+8), pygame.SRCALPHA)
-            border_surf2 = pygame.Surface((box_width+16, box_height+16), pygame.SRCALPHA)
-            border_surf3 = pygame.Surface((box_width+24, box_height+24), pygame.SRCALPHA)
 
+        # Background capsule, brighter for the current player
+        self.info_box_surfs = {}
+        for is_current, bg_color in ((False, (230, 230, 225)), (True, (250, 250, 250))):
+            capsule = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+            pygame.draw.rect(capsule, bg_color,
+                            (0, 0, box_width, box_height),
+                            border_radius=box_height // 2, )
+            self.info_box_surfs[is_current] = capsule.convert_alpha()
+
+        # Border gradient on current player, as (surface, offset from the box corner)
+        self.info_glow_surfs = []
+        for grow, dy, color in ((8, -2, (250, 250, 250, 210)),
+                                (16, -4, (205, 205, 205, 140)),
+                                (24, -6, (205, 205, 205, 70))):
+            border_surf = pygame.Surface((box_width+grow, box_height+grow), pygame.SRCALPHA)
             pygame.draw.rect(
                 border_surf,
-                (*(250, 250, 250), 210),   # RGBA → 120 = semi-transparent
-                (0, 0, box_width+8, box_height+8),
-                width=6,
-                border_radius=(box_height+8) // 2
-            )
-            pygame.draw.rect(
-                border_surf2,
-                (*(205, 205, 205), 140),   # RGBA → 120 = semi-transparent
-                (0, 0, box_width+16, box_height+16),
-                width=6,
-                border_radius=(box_height+16) // 2
-            )
-            pygame.draw.rect(
-                border_surf3,
-                (*(205, 205, 205), 70),   # RGBA → 120 = semi-transparent
-                (0, 0, box_width+24, box_height+24),
+                color,   # RGBA, semi-transparent
+                (0, 0, box_width+grow, box_height+grow),
                 width=6,
-                border_radius=(box_height+24) // 2
+                border_radius=(box_height+grow) // 2
             )
+            self.info_glow_surfs.append((border_surf.convert_alpha(), (-grow // 2, dy)))
 
-            self.screen.blit(border_surf, (box_x-4, box_y-2))
-            self.screen.blit(border_surf2, (box_x-8, box_y-4))
-            self.screen.blit(border_surf3, (box_x-12, box_y-6))
-
-
+        # Seat number circles, built on first use
+        self.seat_badge_cache = {}
 
+    def _seat_badge(self, seat_index):
+        """Seat number circle in the seat color"""
+        badge = self.seat_badge_cache.get(seat_index)
+        if badge is None:
+            circle_radius = 36
+            size = 2 * circle_radius + 1
+            badge = pygame.Surface((size, size), pygame.SRCALPHA)
+            seat_color = self.SEAT_COLORS[seat_index % len(self.SEAT_COLORS)]
+            pygame.draw.circle(badge, seat_color, (circle_radius, circle_radius), circle_radius)
+            num_text = self.seat_num_font.render(str(seat_index), True, self.WHITE)
+            badge.blit(num_text, num_text.get_rect(center=(circle_radius, circle_radius)))
+            badge = badge.convert_alpha()
+            self.seat_badge_cache[seat_index] = badge
+        return badge
+    
+    def draw_player_info_box(self, x, y, player, seat_index, current_player):
+        """Draw player info box with seat number and stack"""
+        box_width = 260
+        box_height = 84
+        is_current = current_player == seat_index
+        
+        box_x = int(x - box_width // 2)
+        box_y = int(y - box_height // 2)
+        
+        # Background; the dirty area also covers the glow and seat badge
+        self.screen.blit(self.info_box_surfs[is_current], (box_x, box_y))
+        self.dirty_rects.append(pygame.Rect(box_x - 12, box_y - 6, box_width + 24, box_height + 24))
+        
+        # Border gradient on current player
+        if is_current:
+            for border_surf, (dx, dy) in self.info_glow_surfs:
+                self.screen.blit(border_surf, (box_x + dx, box_y + dy))
         
         # Seat number circle
         circle_radius = 36
         circle_x = box_x + circle_radius + 10
-        circle_y = y
-        
-        pygame.draw.circle(self.screen, seat_color, (int(circle_x), int(circle_y)), circle_radius)
-        
-        # Seat number
-        seat_num = str(seat_index)
-        num_font = pygame.font.SysFont('arial', 28, bold=True)
-        num_text = num_font.render(seat_num, True, self.WHITE)
-        num_rect = num_text.get_rect(center=(circle_x, circle_y))
-        self.screen.blit(num_text, num_rect)
+        self.screen.blit(self._seat_badge(seat_index), (circle_x - circle_radius, int(y) - circle_radius))
         
         # Stack amount
         stack_str = f"{player['stack']:,}"
         text_color = self.DARK_GRAY if player['status'] != 'sitting_out' else self.WHITE
-        stack_font = pygame.font.SysFont('arial', 40, bold=True)
-        stack_text = stack_font.render(stack_str, True, text_color)
+        stack_text = self._render_text(self.stack_big_font, stack_str, text_color)
         stack_rect = stack_text.get_rect(midleft=(circle_x + circle_radius + 15, y))
-        self.screen.blit(stack_text, stack_rect)
+        self.dirty_rects.append(self.screen.blit(stack_text, stack_rect))
     
     def draw_bet_chip(self, x, y, amount):
         """Draw bet amount chip"""
-        bb_font = pygame.font.SysFont('arial', 32, bold=True)
-        bb_text = bb_font.render(f"{amount} bb", True, self.WHITE)
+        bb_text = self._render_text(self.bet_font, f"{amount} bb", self.WHITE)
         bb_rect = bb_text.get_rect(center=(x, y))
 
         padding_x = 8
@@ -800,15 +911,19 @@ class Render:
             bb_rect.width + padding_x*2,
             bb_rect.height + padding_y*2
         )
-        box_surf = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(
-            box_surf,
-            (0, 0, 0, 120),
-            (0, 0, box_rect.width, box_rect.height),
-            border_radius=box_rect.height // 2
-        )
+        box_surf = self.bet_chip_cache.get(box_rect.size)
+        if box_surf is None:
+            box_surf = pygame.Surface(box_rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(
+                box_surf,
+                (0, 0, 0, 120),
+                (0, 0, box_rect.width, box_rect.height),
+                border_radius=box_rect.height // 2
+            )
+            box_surf = box_surf.convert_alpha()
+            self.bet_chip_cache[box_rect.size] = box_surf
 
-        self.screen.blit(box_surf, (box_rect.x, box_rect.y))
+        self.dirty_rects.append(self.screen.blit(box_surf, (box_rect.x, box_rect.y)))
         self.screen.blit(bb_text, bb_rect)
     
     def draw_community_cards(self, community_cards):
@@ -828,75 +943,61 @@ class Render:
         start_x = center_x - total_width // 2
         
         # Draw each community card
+        blit_list = []
         for i, card in enumerate(community_cards):
             card_x = start_x + i * (card_width + card_spacing)
             
-            # Check if we have a card string (e.g., 'HA', 'D10', 'CK')
-            has_card = card is not None and isinstance(card, str) and len(card) >= 2
-            
-            if has_card:
+            if card is not None:
                 card_surface = self.card_renderer.render_card(card, face_up=True, scaled=True)
-                self.screen.blit(card_surface, (card_x, center_y))
+                blit_list.append((card_surface, (card_x, center_y)))
+        self.dirty_rects.extend(self.screen.blits(blit_list))
+    
+    def build_layout(self):
+        """Lay out the action buttons and perspective slider for the current window size"""
+        panel_y = self.HEIGHT - 230
+
+        # Perspective slider (bottom left corner), bounds also used for interaction
+        self.perspective_slider_bounds = (40, panel_y + 160, 250, 8)
+
+        button_y = panel_y + 40
+        button_width = 250
+        button_height = 70
+        button_spacing = 20
+        
+        total_width = len(self.ACTION_BUTTONS) * button_width + (len(self.ACTION_BUTTONS) - 1) * button_spacing
+        start_x = (self.WIDTH - total_width) // 2
+        
+        self.button_list = []
+        for i, (text, color, hover_color, action) in enumerate(self.ACTION_BUTTONS):
+            btn_x = start_x + i * (button_width + button_spacing)
+            self.button_list.append((btn_x, button_y, button_width, button_height,
+                                     action, text, color, hover_color))
     
     def draw_control_panel(self):
         """Draw the bottom control panel with action buttons and perspective slider"""
         panel_height = 230
         panel_y = self.HEIGHT - panel_height
-        
-        # Panel background
-        pygame.draw.rect(self.screen, (50, 50, 50),
-                        (0, panel_y, self.WIDTH, panel_height))
-        pygame.draw.line(self.screen, (80, 80, 80),
-                        (0, panel_y), (self.WIDTH, panel_y), 3)
+        self.dirty_rects.append(pygame.Rect(0, panel_y - 1, self.WIDTH, panel_height + 1))
         
         # Draw perspective slider (bottom left)
-        self.draw_perspective_slider(panel_y)
+        self.draw_perspective_slider()
         
         # Action buttons
-        button_y = panel_y + 40
-        button_height = 70
-        button_spacing = 20
-        
-        # 5 Allowed Actions at any decision point in PLO8
-        buttons = [
-            ("CHECK / FOLD", (108, 18, 18), (158, 68, 68), "check/fold"),
-            ("CALL / BET MIN", (108, 59, 18), (158, 109, 68), "call/minbet"),
-            ("BET 1/2 POT", (108, 108, 18), (158, 158, 68), "bet1/2pot"),
-            ("BET 3/4 POT", (60, 108, 18), (110, 158, 68), "bet3/4pot"),
-            ("BET POT", (14, 108, 18), (74, 158, 68), "betpot"),
-        ]
-        
-        total_width = len(buttons) * 250 + (len(buttons) - 1) * button_spacing
-        start_x = (self.WIDTH - total_width) // 2
-        
-        # Clear button bounds
-        self.button_bounds = {}
-        
-        for i, (text, color, hover_color, action) in enumerate(buttons):
-            btn_x = start_x + i * (250 + button_spacing)
-            self.draw_button(btn_x, button_y, 250, button_height, 
-                           text, color, hover_color, action)
+        for x, y, w, h, action, text, color, hover_color in self.button_list:
+            self.draw_button(x, y, w, h, text, color, hover_color, action)
         
         # Info text
-        info_font = pygame.font.SysFont('arial', 24)
-        info_text = info_font.render("Your turn to act", True, self.LIGHT_GRAY)
+        info_text = self._render_text(self.small_font, "Your turn to act", self.LIGHT_GRAY)
         info_rect = info_text.get_rect(center=(self.WIDTH // 2, panel_y + 140))
         self.screen.blit(info_text, info_rect)
     
-    def draw_perspective_slider(self, panel_y):
+    def draw_perspective_slider(self):
         """Draw the perspective slider in bottom left corner"""
-        # Slider position (bottom left corner)
-        slider_x = 40
-        slider_y = panel_y + 160
-        slider_width = 250
-        slider_height = 8
-        
-        # Store bounds for interaction
-        self.perspective_slider_bounds = (slider_x, slider_y, slider_width, slider_height)
+        # Slider position, laid out in build_layout
+        slider_x, slider_y, slider_width, slider_height = self.perspective_slider_bounds
         
         # Label
-        label_font = pygame.font.SysFont('arial', 20, bold=True)
-        label_text = label_font.render("Perspective", True, self.WHITE)
+        label_text = self._render_text(self.label_font, "Perspective", self.WHITE)
         self.screen.blit(label_text, (slider_x + 80, slider_y - 30))
         
         # Draw track
@@ -916,19 +1017,15 @@ class Render:
         pygame.draw.circle(self.screen, (80, 80, 80), (handle_x, handle_y), handle_radius, 2)
         
         # Value display
-        value_font = pygame.font.SysFont('arial', 18)
         if self.perspective == 0:
             value_str = "All Cards"
         else:
             value_str = f"Player {self.perspective-1}"
-        value_text = value_font.render(value_str, True, self.LIGHT_GRAY)
+        value_text = self._render_text(self.value_font, value_str, self.LIGHT_GRAY)
         self.screen.blit(value_text, (slider_x + slider_width + 16, slider_y - 8))
     
     def draw_button(self, x, y, w, h, text, color, hover_color, button_id):
-        """Draw a button and track its bounds for click detection"""
-        # Store bounds for click detection
-        self.button_bounds[button_id] = (x, y, w, h)
-        
+        """Draw a button, highlighted while the mouse is over it"""
         # Check hover
         mx, my = self.mouse_pos
         hovered = (x <= mx <= x + w and y <= my <= y + h)
@@ -940,7 +1037,7 @@ class Render:
         pygame.draw.rect(self.screen, self.WHITE, (x, y, w, h), 3, border_radius=0)
         
         # Draw text
-        label = self.large_font.render(text, True, self.WHITE)
+        label = self._render_text(self.large_font, text, self.WHITE)
         label_rect = label.get_rect(center=(x + w//2, y + h//2))
         self.screen.blit(label, label_rect)
     
@@ -1,66 +1,248 @@
 from itertools import combinations
-from pypokerengine.engine.hand_evaluator import HandEvaluator
-from pypokerengine.utils.card_utils import gen_cards
 
-def evalHi(game_state):
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:     # numba is optional, evalHi and simulateEquity fall back to plain Python/NumPy without it
+    njit, prange = None, range
+
+# Card encoding (Cactus-Kev): 32-bit int laid out as xxxbbbbb bbbbbbbb ssssrrrr xxpppppp
+#   b: one bit per rank, bit 16 = deuce ... bit 28 = ace
+#   s: suit bits, clubs 0x1000, diamonds 0x2000, spades 0x4000, hearts 0x8000
+#   r: rank index 0-12 (2 ... A)
+#   p: rank prime, 2 3 4 5 6 7 8 9 T J Q K A -> 2 3 5 7 11 13 17 19 23 29 31 37 41
+# A flush is a single AND over the suit bits. Five distinct ranks are identified by OR-ing the
+# rank bits (a 13-bit table index); paired hands by the product of their primes.
+SUIT_BITS = (0x1000, 0x2000, 0x4000, 0x8000)
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SUIT_MASK = 0xF000
+PRIME_MASK = 0xFF
+RANK_SHIFT = 16
+
+# Decoders, only needed to turn card ints back into 'HA'-style strings for display/JSON
+SUIT_CHARS = dict(zip(SUIT_BITS, 'CDSH'))
+RANK_CHARS = dict(zip(RANK_PRIMES, '23456789TJQKA'))
+
+# Full deck, same order as the old string literal: C2, D2, S2, H2, C3, ... HA
+CARDS = tuple((1 << (RANK_SHIFT + r)) | suit | (r << 8) | prime for r, prime in enumerate(RANK_PRIMES) for suit in SUIT_BITS)
+CARD_STR = {card: SUIT_CHARS[card & SUIT_MASK] + RANK_CHARS[card & PRIME_MASK] for card in CARDS}
+STR_TO_CARD = {string: card for card, string in CARD_STR.items()}
+
+def _prime_product(ranks):
+    """Product of the rank primes for a list of rank indexes (0=2 ... 12=A)"""
+    product = 1
+    for r in ranks:
+        product *= RANK_PRIMES[r]
+    return product
+
+
+def _rank_bits(ranks):
+    """13-bit mask of a list of distinct rank indexes, the same bits a hand's OR-ed cards give after >> RANK_SHIFT"""
+    bits = 0
+    for r in ranks:
+        bits |= 1 << r
+    return bits
+
+
+def _build_tables():
     """
+    Build the hand rank lookup tables once at import.
+
+    Every 5-card hand falls in one of 7462 equivalence classes, ranked
+    1 (royal flush) to 7462 (7-5-4-3-2 offsuit). Since a hand's rank set is
+    identified by the product of its rank primes, the dict tables are keyed on that product.
+    Hands of 5 distinct ranks are also indexed directly by their 13-bit rank mask.
+
     Returns:
-        winners  -> list of player indexes who tied for best hand
-        winhands -> list of their 5-card winning hands (string form)
+        flush_table  -> prime product -> rank, for 5 suited cards (1287 entries)
+        rank_table   -> prime product -> rank, for all other hands (6175 entries)
+        flush_bits   -> 8192-entry list, rank mask -> rank for 5 suited cards
+        unique_bits  -> 8192-entry list, rank mask -> rank for unsuited straights / high cards, 0 elsewhere
+        low_bits     -> 8192-entry list, rank mask -> 8-or-better low (1 = A-2-3-4-5), 0 for no low
     """
+    desc = range(12, -1, -1)    # A, K, Q ... 2
 
-    board = gen_cards(game_state['community_cards'])
+    # 10 straights from A-high down to the wheel (5-4-3-2-A)
+    straights = [tuple(range(top, top - 5, -1)) for top in range(12, 3, -1)] + [(3, 2, 1, 0, 12)]
+    straight_keys = {_prime_product(s) for s in straights}
+    no_pairs = [combo for combo in combinations(desc, 5) if _prime_product(combo) not in straight_keys]
 
-    # Convert each player’s cards into evaluator format
-    all_players = [gen_cards(p['cards']) for p in game_state['players']]
+    flush_table, rank_table = {}, {}
+    flush_bits, unique_bits = [0] * 8192, [0] * 8192
+    rank = 1
 
-    best_rank = -10**18
-    best_hands = []       # store tuples: (player_idx, rank, hand_cards)
+    # straight flushes
+    for s in straights:
+        flush_table[_prime_product(s)] = rank
+        flush_bits[_rank_bits(s)] = rank
+        rank += 1
+    # four of a kind
+    for quad in desc:
+        for kicker in desc:
+            if kicker != quad:
+                rank_table[_prime_product((quad,) * 4 + (kicker,))] = rank
+                rank += 1
+    # full houses
+    for trips in desc:
+        for pair in desc:
+            if pair != trips:
+                rank_table[_prime_product((trips,) * 3 + (pair,) * 2)] = rank
+                rank += 1
+    # flushes
+    for combo in no_pairs:
+        flush_table[_prime_product(combo)] = rank
+        flush_bits[_rank_bits(combo)] = rank
+        rank += 1
+    # straights
+    for s in straights:
+        rank_table[_prime_product(s)] = rank
+        unique_bits[_rank_bits(s)] = rank
+        rank += 1
+    # three of a kind
+    for trips in desc:
+        for kickers in combinations([r for r in desc if r != trips], 2):
+            rank_table[_prime_product((trips,) * 3 + kickers)] = rank
+            rank += 1
+    # two pair
+    for high, low in combinations(desc, 2):
+        for kicker in desc:
+            if kicker != high and kicker != low:
+                rank_table[_prime_product((high, high, low, low, kicker))] = rank
+                rank += 1
+    # one pair
+    for pair in desc:
+        for kickers in combinations([r for r in desc if r != pair], 3):
+            rank_table[_prime_product((pair, pair) + kickers)] = rank
+            rank += 1
+    # high card
+    for combo in no_pairs:
+        rank_table[_prime_product(combo)] = rank
+        unique_bits[_rank_bits(combo)] = rank
+        rank += 1
 
-    # Evaluate each player
-    for p_idx, hole_cards in enumerate(all_players):
+    assert rank - 1 == 7462, rank
 
-        player_best_rank = -10**18
-        player_best_hand = None
+    # 8-or-better lows: 5 distinct ranks from A..8 (Aces low), best hand has the lowest top card
+    low_ranks = (12, 0, 1, 2, 3, 4, 5, 6)  # A, 2, 3, 4, 5, 6, 7, 8 as rank indexes
+    lows = sorted(combinations(range(8), 5), key=lambda combo: sorted(combo, reverse=True))
+    low_bits = [0] * 8192
+    for i, combo in enumerate(lows):
+        low_bits[_rank_bits([low_ranks[v] for v in combo])] = i + 1
 
-        # All 6 combos of 2 hole cards
-        for hole_combo in combinations(hole_cards, 2):
-            # All 10 combos of 3 board cards
-            for board_combo in combinations(board, 3):
-                rank = HandEvaluator.eval_hand(list(hole_combo), list(board_combo))
+    return flush_table, rank_table, flush_bits, unique_bits, low_bits
 
-                if rank > player_best_rank:
-                    player_best_rank = rank
-                    player_best_hand = list(hole_combo) + list(board_combo)
 
-        # Track this player’s best
-        best_hands.append((p_idx, player_best_rank, player_best_hand))
+_FLUSH_TABLE, _RANK_TABLE, _FLUSH_BITS, _UNIQUE_BITS, _LOW_BITS = _build_tables()
+_LOW_PRIMES = frozenset(RANK_PRIMES[:7] + RANK_PRIMES[-1:])   # 2-8 and the ace
 
-        # Track table best
-        if player_best_rank > best_rank:
-            best_rank = player_best_rank
+# The same tables as one sorted array for batch lookups with np.searchsorted.
+# Products stay below 2**27 (41**4 * 37), so the flush flag goes in bit 27.
+_FLUSH_KEY = 1 << 27
+_LOOKUP_KEYS = np.array(sorted([product | _FLUSH_KEY for product in _FLUSH_TABLE] + list(_RANK_TABLE)), dtype=np.int64)
+_LOOKUP_RANKS = np.array([_FLUSH_TABLE[key ^ _FLUSH_KEY] if key & _FLUSH_KEY else _RANK_TABLE[key]
+                          for key in _LOOKUP_KEYS.tolist()], dtype=np.int16)
 
-    # Determine winners
-    winners = []
-    winning_hands = []
+# Array copies of the rank-mask tables plus the paired hands only, for the numba kernel:
+# only paired hands fall through to a binary search
+_FLUSH_BITS_ARR = np.array(_FLUSH_BITS, dtype=np.int16)
+_UNIQUE_BITS_ARR = np.array(_UNIQUE_BITS, dtype=np.int16)
+_UNIQUE_RANKS = frozenset(_UNIQUE_BITS)
+_PAIRED_KEYS = np.array(sorted(product for product, rank in _RANK_TABLE.items() if rank not in _UNIQUE_RANKS), dtype=np.int64)
+_PAIRED_RANKS = np.array([_RANK_TABLE[product] for product in _PAIRED_KEYS.tolist()], dtype=np.int16)
 
-    for p_idx, rank, hand in best_hands:
-        if rank == best_rank:
-            winners.append(game_state['players'][p_idx])  # <- store dict, not index
-            winning_hands.append([str(c) for c in hand])
+_DECK = np.array(CARDS, dtype=np.int64)
+_HOLE_PAIRS = tuple(combinations(range(4), 2))
+_BOARD_TRIPLES = tuple(combinations(range(5), 3))
+_rng = np.random.default_rng()
 
-    return winners, winning_hands
 
+def _eval5(c1, c2, c3, c4, c5):
+    """Rank a 5-card hand of card ints: 1 (royal flush) ... 7462 (7-5-4-3-2 offsuit)"""
+    if c1 & c2 & c3 & c4 & c5 & SUIT_MASK:
+        return _FLUSH_BITS[(c1 | c2 | c3 | c4 | c5) >> RANK_SHIFT]
+    return _RANK_TABLE[(c1 & PRIME_MASK) * (c2 & PRIME_MASK) * (c3 & PRIME_MASK) * (c4 & PRIME_MASK) * (c5 & PRIME_MASK)]
+
+
+def _holePairs(hole_cards):
+    """The 6 two-card hole combos as (prime product, shared suit bits, rank bits, cards)"""
+    return [((a & PRIME_MASK) * (b & PRIME_MASK), a & b & SUIT_MASK, (a | b) >> RANK_SHIFT, (a, b))
+            for a, b in combinations(hole_cards, 2)]
+
+
+def _boardTriples(board):
+    """The 10 three-card board combos as (prime product, shared suit bits, rank bits, cards)"""
+    return [((a & PRIME_MASK) * (b & PRIME_MASK) * (c & PRIME_MASK), a & b & c & SUIT_MASK, (a | b | c) >> RANK_SHIFT, (a, b, c))
+            for a, b, c in combinations(board, 3)]
+
+
+def _lowCombos(combos):
+    """Keep only combos of distinct ranks all 8 or under, the only ones that can finish in a low"""
+    return [combo for combo in combos if all(card & PRIME_MASK in _LOW_PRIMES for card in combo[3])
+            and len({card & PRIME_MASK for card in combo[3]}) == len(combo[3])]
+
+
+def _bestHiHand(hole_cards, triples):
+    """Best (rank, 5 cards) for one player from their hole cards and the shared board triples"""
+    best_rank = 7463
+    best_hand = None
+    # 6 hole pairs x 10 board triples: one table lookup each, by rank bits for flushes
+    # and by prime product for everything else
+    for pair_product, pair_suits, pair_bits, pair in _holePairs(hole_cards):
+        for triple_product, triple_suits, triple_bits, triple in triples:
+            if pair_suits & triple_suits:
+                rank = _FLUSH_BITS[pair_bits | triple_bits]
+            else:
+                rank = _RANK_TABLE[pair_product * triple_product]
+
+            if rank < best_rank:
+                best_rank = rank
+                best_hand = pair + triple
+    return best_rank, best_hand
+
+
+def evalHi(game_state):
+    """
+    Evaluate the best high hand for each player (exactly 2 hole cards + 3 board cards).
+    With numba installed every player is ranked in one compiled call and only the
+    winners are searched again for their 5 cards.
+    Returns:
+        winners  -> list of player dicts who tied for best hand
+        winhands -> list of their 5-card winning hands (string form)
+    """
+    board = [STR_TO_CARD[c] for c in game_state['community_cards']]
+
+    # Board triples are the same for every player, so their products are built once
+    triples = _boardTriples(board)
+
+    # Convert each player's cards into card ints
+    all_players = [[STR_TO_CARD[c] for c in p['cards']] for p in game_state['players']]
+
+    if njit is not None:
+        ranks = _showdownHiKernel(np.array(all_players, dtype=np.int64), np.array(board, dtype=np.int64),
+                                  _FLUSH_BITS_ARR, _UNIQUE_BITS_ARR, _PAIRED_KEYS, _PAIRED_RANKS).tolist()
+        best_rank = min(ranks)
+        winner_idx = [p_idx for p_idx, rank in enumerate(ranks) if rank == best_rank]
+        hands = [_bestHiHand(all_players[p_idx], triples)[1] for p_idx in winner_idx]
+    else:
+        best_hands = [_bestHiHand(hole_cards, triples) for hole_cards in all_players]
+        best_rank = min(rank for rank, _ in best_hands)
+        winner_idx = [p_idx for p_idx, (rank, _) in enumerate(best_hands) if rank == best_rank]
+        hands = [best_hands[p_idx][1] for p_idx in winner_idx]
+
+    winners = [game_state['players'][p_idx] for p_idx in winner_idx]   # <- store dict, not index
+    winning_hands = [[CARD_STR[c] for c in hand] for hand in hands]
+    return winners, winning_hands
 
-from itertools import combinations
 
 def evalLo(game_state):
     """
     Evaluate 8-or-better low hands for each player (Aces count as 1).
     Returns winners as player dicts and the winning hands.
     """
-    board = gen_cards(game_state['community_cards'])
-    all_players = [gen_cards(p['cards']) for p in game_state['players']]
+    # Only board triples of distinct low ranks can play, and they're shared by every player
+    triples = _lowCombos(_boardTriples([STR_TO_CARD[c] for c in game_state['community_cards']]))
+    all_players = [[STR_TO_CARD[c] for c in p['cards']] for p in game_state['players']]
 
     best_low_val = None
     best_hands = []
@@ -69,29 +251,16 @@ def evalLo(game_state):
         player_best_low = None
         player_best_hand = None
 
-        # All 2-card hole combos
-        for hole_combo in combinations(hole_cards, 2):
-            # All 3-card board combos
-            for board_combo in combinations(board, 3):
-                hand = list(hole_combo) + list(board_combo)
-
-                # Convert Ace -> 1
-                low_ranks = [1 if c.rank == 14 else c.rank for c in hand]
-
-                # Valid low: all ≤8
-                if max(low_ranks) > 8:
-                    continue
-
-                # Distinct ranks
-                if len(set(low_ranks)) < 5:
+        for _, _, pair_bits, pair in _lowCombos(_holePairs(hole_cards)):
+            for _, _, triple_bits, triple in triples:
+                # Valid low: 5 distinct ranks, all 8 or under; anything else (e.g. a shared rank) is 0 in the table
+                low_val = _LOW_BITS[pair_bits | triple_bits]
+                if not low_val:
                     continue
 
-                # Sort descending: highest card first
-                low_val = tuple(sorted(low_ranks, reverse=True))
-
                 if player_best_low is None or low_val < player_best_low:
                     player_best_low = low_val
-                    player_best_hand = hand
+                    player_best_hand = pair + triple
 
         if player_best_low is None:
             continue
@@ -103,8 +272,168 @@ def evalLo(game_state):
             best_hands.append((p_idx, player_best_hand))
 
     winners = [game_state['players'][p_idx] for p_idx, _ in best_hands]
-    winning_hands = [[str(c) for c in hand] for _, hand in best_hands]
+    winning_hands = [[CARD_STR[c] for c in hand] for _, hand in best_hands]
 
     return winners, winning_hands
 
 
+def _batchBoardTriples(boards):
+    """
+    The 10 board triples of every deal as prime products and ANDs of suit bits.
+    They only depend on the board, so they're built once and shared by every player at the table.
+    Args:
+        boards: int array (n, 5) of board card ints
+    Returns:
+        (triple_primes, triple_suits, triple_bits): three int arrays (n, 10)
+    """
+    board_primes, board_suits, board_bits = boards & PRIME_MASK, boards & SUIT_MASK, boards >> RANK_SHIFT
+    triple_primes = np.stack([board_primes[:, i] * board_primes[:, j] * board_primes[:, k] for i, j, k in _BOARD_TRIPLES], axis=1)
+    triple_suits = np.stack([board_suits[:, i] & board_suits[:, j] & board_suits[:, k] for i, j, k in _BOARD_TRIPLES], axis=1)
+    triple_bits = np.stack([board_bits[:, i] | board_bits[:, j] | board_bits[:, k] for i, j, k in _BOARD_TRIPLES], axis=1)
+    return triple_primes, triple_suits, triple_bits
+
+
+def _bestHiKernel(holes, triple_primes, triple_suits, triple_bits, flush_ranks, unique_ranks, paired_keys, paired_ranks):
+    """Row-by-row loop version of _batchBestHi, compiled with numba when it is installed"""
+    n, players = holes.shape[0], holes.shape[1]
+    best = np.empty((n, players), dtype=np.int16)
+    for row in prange(n):
+        for player in range(players):
+            player_best = 7463
+            for i in range(3):
+                for j in range(i + 1, 4):
+                    a, b = holes[row, player, i], holes[row, player, j]
+                    pair_product = (a & PRIME_MASK) * (b & PRIME_MASK)
+                    pair_suits = a & b & SUIT_MASK
+                    pair_bits = (a | b) >> RANK_SHIFT
+                    for t in range(10):
+                        bits = pair_bits | triple_bits[row, t]
+                        if pair_suits & triple_suits[row, t]:
+                            rank = flush_ranks[bits]
+                        else:
+                            rank = unique_ranks[bits]
+                            if rank == 0:
+                                rank = paired_ranks[np.searchsorted(paired_keys, pair_product * triple_primes[row, t])]
+                        if rank < player_best:
+                            player_best = rank
+            best[row, player] = player_best
+    return best
+
+
+if njit is not None:
+    _bestHiKernel = njit(parallel=True, cache=True)(_bestHiKernel)
+
+
+def _showdownHiKernel(holes, board, flush_ranks, unique_ranks, paired_keys, paired_ranks):
+    """
+    Best high rank of each player at one showdown, compiled with numba when it is installed.
+    A single deal is too small for the batch path: the board triples are built in the loop
+    instead of with NumPy, and there is no thread pool to start.
+    """
+    triple_primes = np.empty(10, dtype=np.int64)
+    triple_suits = np.empty(10, dtype=np.int64)
+    triple_bits = np.empty(10, dtype=np.int64)
+    t = 0
+    for i in range(3):
+        for j in range(i + 1, 4):
+            for k in range(j + 1, 5):
+                a, b, c = board[i], board[j], board[k]
+                triple_primes[t] = (a & PRIME_MASK) * (b & PRIME_MASK) * (c & PRIME_MASK)
+                triple_suits[t] = a & b & c & SUIT_MASK
+                triple_bits[t] = (a | b | c) >> RANK_SHIFT
+                t += 1
+    best = np.empty(holes.shape[0], dtype=np.int16)
+    for player in range(holes.shape[0]):
+        player_best = 7463
+        for i in range(3):
+            for j in range(i + 1, 4):
+                a, b = holes[player, i], holes[player, j]
+                pair_product = (a & PRIME_MASK) * (b & PRIME_MASK)
+                pair_suits = a & b & SUIT_MASK
+                pair_bits = (a | b) >> RANK_SHIFT
+                for t in range(10):
+                    bits = pair_bits | triple_bits[t]
+                    if pair_suits & triple_suits[t]:
+                        rank = flush_ranks[bits]
+                    else:
+                        rank = unique_ranks[bits]
+                        if rank == 0:
+                            rank = paired_ranks[np.searchsorted(paired_keys, pair_product * triple_primes[t])]
+                    if rank < player_best:
+                        player_best = rank
+        best[player] = player_best
+    return best
+
+
+if njit is not None:
+    _showdownHiKernel = njit(cache=True)(_showdownHiKernel)
+
+
+def _batchBestHi(holes, boards):
+    """
+    Best PLO high rank for every player in a batch of deals, all rows at once.
+    Args:
+        holes: int array (n, players, 4) of hole card ints
+        boards: int array (n, 5) of board card ints
+    Returns:
+        int array (n, players) of best ranks (lower is better)
+    """
+    triple_primes, triple_suits, triple_bits = _batchBoardTriples(boards)
+    if njit is not None:
+        return _bestHiKernel(np.ascontiguousarray(holes), triple_primes, triple_suits, triple_bits,
+                             _FLUSH_BITS_ARR, _UNIQUE_BITS_ARR, _PAIRED_KEYS, _PAIRED_RANKS)
+
+    # 6 hole pairs per player, each as a prime product and an AND of suit bits, against the shared triples
+    hole_primes, hole_suits = holes & PRIME_MASK, holes & SUIT_MASK
+    pair_primes = np.stack([hole_primes[..., i] * hole_primes[..., j] for i, j in _HOLE_PAIRS], axis=-1)
+    pair_suits = np.stack([hole_suits[..., i] & hole_suits[..., j] for i, j in _HOLE_PAIRS], axis=-1)
+
+    keys = pair_primes[..., :, None] * triple_primes[:, None, None, :]
+    keys |= np.where((pair_suits[..., :, None] & triple_suits[:, None, None, :]) != 0, _FLUSH_KEY, 0)
+    ranks = _LOOKUP_RANKS[np.searchsorted(_LOOKUP_KEYS, keys)]
+    return ranks.reshape(holes.shape[0], holes.shape[1], -1).min(axis=2)
+
+
+def simulateEquity(hole_cards, community_cards, n=1000, opponents=1, rng=None):
+    """
+    Monte-Carlo equity of a PLO high hand against random opponent hands.
+    Every rollout is dealt and evaluated in one batch of NumPy operations.
+
+    Args:
+        hole_cards: the player's 4 hole cards (e.g. ['HA', 'HK', 'D2', 'C3'])
+        community_cards: the 0, 3, 4 or 5 known board cards
+        n: number of rollouts
+        opponents: number of random opponent hands
+        rng: numpy Generator to deal from, for repeatable estimates (default: the module's own)
+
+    Returns:
+        float: share of the pot won on average, ties split evenly
+    """
+    hole = np.array([STR_TO_CARD[c] for c in hole_cards], dtype=np.int64)
+    board = np.array([STR_TO_CARD[c] for c in community_cards], dtype=np.int64)
+    remaining = np.setdiff1d(_DECK, np.concatenate((hole, board)))
+
+    # Deal the rest of the board then each opponent's 4 cards from a random permutation per rollout
+    board_needed = 5 - len(board)
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+    if opponents < 1:
+        raise ValueError(f"opponents must be at least 1, got {opponents}")
+    if board_needed + 4 * opponents > remaining.size:
+        raise ValueError(f"Not enough cards left for {opponents} opponents: "
+                         f"need {board_needed + 4 * opponents}, {remaining.size} remain")
+    if rng is None:
+        rng = _rng
+    idx = np.argsort(rng.random((n, remaining.size)), axis=1)[:, :board_needed + 4 * opponents]
+    sampled = remaining[idx]
+    boards = np.concatenate((np.broadcast_to(board, (n, len(board))), sampled[:, :board_needed]), axis=1)
+
+    # Hero in column 0, then the opponents, all ranked against the same boards in one call
+    hands = np.concatenate((np.broadcast_to(hole, (n, 1, 4)), sampled[:, board_needed:].reshape(n, opponents, 4)), axis=1)
+    ranks = _batchBestHi(hands, boards)
+    hero, villains = ranks[:, 0], ranks[:, 1:]
+
+    best_villain = villains.min(axis=1)
+    ties = (villains == hero[:, None]).sum(axis=1)
+    share = np.where(hero < best_villain, 1.0, np.where(hero == best_villain, 1.0 / (ties + 1), 0.0))
+    return float(share.mean())
@@ -9,7 +9,9 @@ Connects GameController and GameRenderer
 NUM_PLAYERS = 2
 STARTING_STACK = 1000.00
 HUMAN_IN_LOOP = True
-SETTINGS = [NUM_PLAYERS, STARTING_STACK, HUMAN_IN_LOOP]
+VERBOSE = True
+DUMP_STATE = True
+SETTINGS = [NUM_PLAYERS, STARTING_STACK, HUMAN_IN_LOOP, VERBOSE, DUMP_STATE]
 
 #                                                                           #
 #############################################################################
@@ -70,6 +72,7 @@ def main(settings):
         renderer.render(game_state)
     
     # Cleanup
+    controller.close()
     renderer.cleanup()
     print("Game ended")
 
@@ -0,0 +1,53 @@
+"""
+simulate.py - Headless batch simulation for PLO8
+Plays games with random actions and no renderer or ANN, to benchmark the controller.
+Also starts under PyPy (pypy3 simulate.py) if numpy is installed there; numba is not
+available under PyPy, so hand evaluation falls back to plain Python/NumPy. The PyPy
+speedup has not been measured.
+"""
+
+#############################################################################
+#                           CONTROL SETTINGS                                #
+
+NUM_PLAYERS = 2
+STARTING_STACK = 100.00
+NUM_GAMES = 1000
+MAX_ACTIONS = 5000      # per game, in case a game never finishes
+SEED = None             # set an int for a repeatable run (actions, shuffles and dealer draws)
+SETTINGS = [NUM_PLAYERS, STARTING_STACK, False, False, False, None]
+
+#                                                                           #
+#############################################################################
+
+import random
+import time
+
+import GameController
+
+ACTIONS = ('check/fold', 'call/minbet', 'bet1/2pot', 'bet3/4pot', 'betpot')
+
+
+def main(settings):
+    """Play NUM_GAMES games of random actions and report the throughput"""
+    rng = random.Random(SEED)
+    total_actions = 0
+    start = time.perf_counter()
+
+    for _ in range(NUM_GAMES):
+        # Each game's deck gets its own seed drawn from the run seed
+        if SEED is not None:
+            settings = settings[:5] + [rng.getrandbits(32)]
+        controller = GameController.PLO8(settings)
+        actions = 0
+        while controller.running and actions < MAX_ACTIONS:
+            controller.advance_game(rng.choice(ACTIONS))
+            actions += 1
+        total_actions += actions
+
+    elapsed = time.perf_counter() - start
+    print(f"Players: {settings[0]}, Stack: {settings[1]} bb, Games: {NUM_GAMES}")
+    print(f"{total_actions} actions in {elapsed:.2f}s ({total_actions / elapsed:,.0f} actions/s)")
+
+
+if __name__ == "__main__":
+    main(SETTINGS)